@@ -417,7 +417,7 @@ class DeyeApp(ctk.CTk):
         # If any default schedule has selling enabled, disable boost protection at startup
         # to prevent it from fighting the intentional battery export
         any_sell = any(
-            s.get("sell", False) for s in self.schedule_panel.get_all_schedules() if s
+            s.sell for s in self.schedule_panel.get_all_schedules() if s
         )
         if any_sell and self.protection_panel.is_enabled():
             self._protection_disabled_by_sell = True
@@ -536,12 +536,12 @@ class DeyeApp(ctk.CTk):
         
         # Determine what settings to apply
         if active_schedule is not None:
-            target_max = active_schedule["max_charge_amps"]
-            target_grid = active_schedule["grid_charge_amps"]
-            target_discharge = active_schedule["max_discharge_amps"]
-            target_sell = active_schedule.get("sell", False)
-            target_sell_power = active_schedule.get("sell_power", 0)
-            min_batt_pct = active_schedule.get("min_batt_pct", 0)
+            target_max = active_schedule.max_charge_amps
+            target_grid = active_schedule.grid_charge_amps
+            target_discharge = active_schedule.max_discharge_amps
+            target_sell = active_schedule.sell
+            target_sell_power = active_schedule.sell_power
+            min_batt_pct = active_schedule.min_batt_pct
 
             # Suppress sell when battery SOC is below the slot's minimum
             current_soc = data.soc if data is not None else 100
@@ -557,10 +557,10 @@ class DeyeApp(ctk.CTk):
                     print(f"[SCHEDULE] Battery sell restored: SOC {current_soc}% >= min {min_batt_pct}%")
 
             schedule_key = (
-                active_schedule["start_hour"],
-                active_schedule["start_min"],
-                active_schedule["end_hour"],
-                active_schedule["end_min"],
+                active_schedule.start_hour,
+                active_schedule.start_min,
+                active_schedule.end_hour,
+                active_schedule.end_min,
                 target_max,
                 target_grid,
                 target_discharge,
@@ -1144,7 +1144,7 @@ class DeyeApp(ctk.CTk):
         if self.schedule_panel.is_enabled():
             active_schedule = self.schedule_panel.get_active_schedule()
             if active_schedule:
-                return active_schedule["max_charge_amps"]
+                return active_schedule.max_charge_amps
         # Use defaults
         defaults = self.schedule_panel.get_default_values()
         return defaults["max_charge_amps"]
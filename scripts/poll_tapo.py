@@ -0,0 +1,35 @@
+"""
+Poll a Tapo P110 plug's on/off state from a single event loop.
+
+Usage: python scripts/poll_tapo.py [--count N] [--interval SECONDS] [--loop]
+Credentials come from TAPO_EMAIL, TAPO_PASSWORD and TAPO_IP (.env is loaded).
+"""
+import argparse
+import asyncio
+import os
+from dotenv import load_dotenv
+from tapo import ApiClient
+
+
+async def poll(count: int, interval: float, loop: bool) -> None:
+    # Log in once; the device handle is reused for every poll
+    client = ApiClient(os.environ["TAPO_EMAIL"], os.environ["TAPO_PASSWORD"])
+    device = await client.p110(os.environ["TAPO_IP"])
+    polls = 0
+    while loop or polls < count:
+        if polls:
+            await asyncio.sleep(interval)
+        info = await device.get_device_info()
+        print(f"Device on: {info.device_on}")
+        polls += 1
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Poll a Tapo P110 plug's state.")
+    parser.add_argument("--count", type=int, default=10, help="number of polls (default: 10)")
+    parser.add_argument("--interval", type=float, default=5.0, help="seconds between polls (default: 5)")
+    parser.add_argument("--loop", action="store_true", help="poll until interrupted")
+    args = parser.parse_args()
+
+    load_dotenv()
+    asyncio.run(poll(args.count, args.interval, args.loop))
@@ -218,6 +218,24 @@ class EVChargerConfig:
     cloud_amps_code: str = field(default_factory=lambda: os.getenv("EV_CHARGER_CLOUD_AMPS_CODE", "Set32A"))  # Cloud DP code for amps (Set16A/Set32A/Set40A/Set50A)
 
 
+@dataclass(slots=True)
+class ScheduleSlot:
+    """A single time-based charge/sell schedule slot."""
+    start_hour: int
+    start_min: int
+    end_hour: int
+    end_min: int
+    max_charge_amps: int
+    grid_charge_amps: int
+    max_discharge_amps: int
+    sell: bool = False
+    sell_power: int = 0
+    min_batt_pct: int = 20
+    enabled: bool = True
+    # Status line shown while the slot is active, filled in when the schedule table is built
+    display_text: str = field(default="", compare=False, repr=False)
+
+
 @dataclass
 class HeatpumpScheduleSlot:
     """A single time-based temperature schedule slot for the heat pump."""
@@ -323,7 +341,7 @@ class SunsetChargingConfig:
     selling_first_quality_threshold: float = field(default_factory=lambda: float(os.getenv("SUNSET_SELLING_FIRST_QUALITY", "0.80")))
 
 
-def load_default_schedules() -> list:
+def load_default_schedules() -> List[ScheduleSlot]:
     """Load default schedule rows from environment variables.
     
     Format: SCHEDULE_N=HH:MM-HH:MM,max_charge,grid_charge,max_discharge,sell|nosell,min_batt_pct,sell_power
@@ -346,16 +364,16 @@ def load_default_schedules() -> list:
             start_str, end_str = time_range.split("-")
             sh, sm = start_str.split(":")
             eh, em = end_str.split(":")
-            schedules.append({
-                "start_hour": int(sh), "start_min": int(sm),
-                "end_hour": int(eh), "end_min": int(em),
-                "max_charge_amps": int(max_charge),
-                "grid_charge_amps": int(grid_charge),
-                "max_discharge_amps": int(max_discharge),
-                "sell": sell_mode.strip().lower() == "sell",
-                "min_batt_pct": int(min_batt_pct),
-                "sell_power": int(sell_power),
-            })
+            schedules.append(ScheduleSlot(
+                start_hour=int(sh), start_min=int(sm),
+                end_hour=int(eh), end_min=int(em),
+                max_charge_amps=int(max_charge),
+                grid_charge_amps=int(grid_charge),
+                max_discharge_amps=int(max_discharge),
+                sell=sell_mode.strip().lower() == "sell",
+                min_batt_pct=int(min_batt_pct),
+                sell_power=int(sell_power),
+            ))
         except (ValueError, IndexError):
             print(f"[CONFIG] Warning: Could not parse SCHEDULE_{i}={raw}")
         i += 1
@@ -2,29 +2,108 @@
 UI Components for Deye Inverter EMS application.
 """
 
+import datetime
+import re
+import time
 import customtkinter as ctk
-from typing import List, Tuple, Callable
+from bisect import bisect_left
+from contextlib import contextmanager
+from functools import lru_cache
+from operator import attrgetter
+from types import MappingProxyType
+from typing import List, Mapping, Optional, Tuple, Callable
 
-from src.config import protection_config, deye_config, sunset_config, ev_charger_config, default_schedules, heatpump_config, heatpump_schedules, HeatpumpScheduleSlot
+from src.config import protection_config, deye_config, sunset_config, ev_charger_config, default_schedules, heatpump_config, heatpump_schedules, HeatpumpScheduleSlot, ScheduleSlot
 
 # Default charge current limits (Amps) - loaded from config
 DEFAULT_MAX_CHARGE_AMPS = deye_config.default_max_charge_amps
 DEFAULT_GRID_CHARGE_AMPS = deye_config.default_grid_charge_amps
 DEFAULT_MAX_DISCHARGE_AMPS = deye_config.default_max_discharge_amps
 
-class PhaseDisplay(ctk.CTkFrame):
+# Shared UI colors (one object per color, so label memo comparisons hit the identity fast path)
+COLOR_RED = "#E74C3C"
+COLOR_AMBER = "#F39C12"
+COLOR_GREEN = "#2ECC71"
+COLOR_GRAY = "#888888"
+COLOR_BLUE = "#3498DB"
+COLOR_ORANGE = "#FFA500"
+COLOR_TK_GRAY = "gray"
+COLOR_GOLD = "#FFD700"
+COLOR_WHITE = "white"
+
+# Zero-padded "00".."99" for clock fields
+_TWO_DIGIT = tuple(f"{i:02d}" for i in range(100))
+
+
+def _pad2(value: int) -> str:
+    """Zero-pad a clock field from the _TWO_DIGIT table."""
+    if 0 <= value < 100:
+        return _TWO_DIGIT[value]
+    return f"{value:02d}"
+
+
+def _hhmm(hour: int, minute: int) -> str:
+    """Format HH:MM from the _TWO_DIGIT table (hand-typed values outside it are formatted)."""
+    if 0 <= hour < 100 and 0 <= minute < 100:
+        return _TWO_DIGIT[hour] + ":" + _TWO_DIGIT[minute]
+    return f"{hour:02d}:{minute:02d}"
+
+
+@lru_cache(maxsize=None)
+def _font(size: int, weight: str = "normal", family: str = "Roboto") -> ctk.CTkFont:
+    """Shared CTkFont instance (created on first use, fonts need a Tk root)."""
+    return ctk.CTkFont(family=family, size=size, weight=weight)
+
+
+class _Throttler:
+    """
+    Widget mixin for updaters called in bursts: the public updater hands its
+    arguments to _defer() and only the latest call per updater is applied, once,
+    on the next idle. Call _init_throttler() from __init__.
+    """
+    
+    def _init_throttler(self) -> None:
+        self._throttle_pending = {}
+        self._throttle_scheduled = False
+    
+    def _defer(self, apply: Callable, *args) -> None:
+        """Queue ``apply(*args)`` for the next idle, replacing an earlier queued call to it."""
+        self._throttle_pending[apply] = args
+        if not self._throttle_scheduled:
+            self._throttle_scheduled = True
+            self.after_idle(self._flush_throttled)
+    
+    def _flush_throttled(self) -> None:
+        self._throttle_scheduled = False
+        pending, self._throttle_pending = self._throttle_pending, {}
+        for apply, args in pending.items():
+            apply(*args)
+
+
+class PhaseDisplay(_Throttler, ctk.CTkFrame):
     """Display widget for a single phase (voltage, load bar, power)."""
     
+    # Label templates, parsed once
+    _VOLT_FMT = "{} V".format
+    _UPS_FMT = "UPS: {} W".format
+    _GRID_FMT = "Grid: {} W".format
+    
     def __init__(self, parent, phase_name: str, **kwargs):
         super().__init__(parent, fg_color="#2B2B2B", **kwargs)
         self.phase_name = phase_name
         
+        # Last (voltage, load, ups_load, max_load) and bar fraction rendered, see update()
+        self._last = (None, None, None, None)
+        self._last_bar = 0
+        self._inv_max = 0.0
+        self._init_throttler()
+        
         self.grid_columnconfigure(1, weight=1)
         
         # Voltage label
         self.lbl_voltage = ctk.CTkLabel(
             self, text="0.0 V",
-            font=("Roboto", 22, "bold"),
+            font=_font(22, "bold"),
             text_color="#00BFFF",
             width=110
         )
@@ -38,8 +117,8 @@ class PhaseDisplay(ctk.CTkFrame):
         # UPS load label (backup port loads) - switched to first position, yellow
         self.lbl_ups = ctk.CTkLabel(
             self, text="UPS: 0 W",
-            font=("Roboto", 20, "bold"),
-            text_color="#FFA500",
+            font=_font(20, "bold"),
+            text_color=COLOR_ORANGE,
             width=110
         )
         self.lbl_ups.grid(row=0, column=2, padx=(20, 5), rowspan=2)
@@ -47,24 +126,60 @@ class PhaseDisplay(ctk.CTkFrame):
         # Grid label (External CT readings) - switched to second position, dynamic color
         self.lbl_grid = ctk.CTkLabel(
             self, text="Grid: 0 W",
-            font=("Roboto", 20, "bold"),
-            text_color="#888888",
+            font=_font(20, "bold"),
+            text_color=COLOR_GRAY,
             width=110
         )
         self.lbl_grid.grid(row=0, column=3, padx=(5, 10), rowspan=2)
 
     def update(self, voltage: float, load: int, ups_load: int, max_load: int) -> None:
-        """Update the phase display with new values."""
-        self.lbl_voltage.configure(text=f"{voltage} V")
-        self.lbl_ups.configure(text=f"UPS: {ups_load} W")
-        
-        # Grid: grey when importing (positive), green when exporting (negative)
-        grid_color = "#2ECC71" if load < 0 else "#888888"
-        self.lbl_grid.configure(text=f"Grid: {load} W", text_color=grid_color)
-        
-        # Use load (grid_loads) for progress bar
-        self.bar.set(min(abs(load) / max_load, 1.0) if max_load > 0 else 0)
-        self.bar.set(min(abs(load) / max_load, 1.0) if max_load > 0 else 0)
+        """Update the phase display with new values (applied on the next idle)."""
+        self._defer(self._apply, voltage, load, ups_load, max_load)
+    
+    def _apply(self, voltage: float, load: int, ups_load: int, max_load: int) -> None:
+        """Render phase values, only touching widgets whose value changed."""
+        values = (voltage, load, ups_load, max_load)
+        last = self._last
+        if values == last:
+            return
+        self._last = values
+        last_voltage, last_load, last_ups_load, last_max_load = last
+        
+        if voltage != last_voltage:
+            self.lbl_voltage.configure(text=self._VOLT_FMT(voltage))
+        if ups_load != last_ups_load:
+            self.lbl_ups.configure(text=self._UPS_FMT(ups_load))
+        
+        if load != last_load:
+            # Grid: grey when importing (positive), green when exporting (negative)
+            grid_color = COLOR_GREEN if load < 0 else COLOR_GRAY
+            self.lbl_grid.configure(text=self._GRID_FMT(load), text_color=grid_color)
+        
+        if max_load != last_max_load:
+            # Bar scale per watt, recomputed only when the phase limit changes
+            self._inv_max = 1.0 / max_load if max_load > 0 else 0.0
+        
+        if load != last_load or max_load != last_max_load:
+            # Use load (grid_loads) for progress bar; the fraction is rounded to
+            # 0.5% steps since every set() redraws the bar canvas
+            fraction = abs(load) * self._inv_max
+            if fraction > 1.0:
+                fraction = 1.0
+            fraction = round(fraction * 200) / 200
+            if fraction != self._last_bar:
+                self._last_bar = fraction
+                self.bar.set(fraction)
+
+
+# Outlet logic widget visuals: manual mode (red, locked) wins over invalid config (purple)
+_MANUAL_COLORS = {True: COLOR_RED, False: COLOR_WHITE}
+_MANUAL_STATES = {True: "disabled", False: "normal"}
+_LOGIC_ENTRY_COLORS = {
+    (False, False): COLOR_WHITE,
+    (False, True): "#A569BD",
+    (True, False): COLOR_RED,
+    (True, True): COLOR_RED,
+}
 
 
 class OutletSettingsPanel(ctk.CTkFrame):
@@ -74,22 +189,29 @@ class OutletSettingsPanel(ctk.CTkFrame):
         super().__init__(parent, fg_color="#1E1E1E", corner_radius=10, border_width=1, border_color="#333333", **kwargs)
         self.outlet_name = outlet_name
         self.variables = variables
-        self.logic_widgets: List[Tuple[ctk.CTkLabel, ctk.CTkEntry]] = []
+        # Logic setting labels and entries, kept as parallel sequences
+        # (lists while the body is built, frozen to tuples afterwards)
+        self._logic_labels: List[ctk.CTkLabel] = []
+        self._logic_entries: List[ctk.CTkEntry] = []
+        
+        # Last visual flags applied to the logic widgets (None until first set)
+        self._last_manual = None
+        self._last_invalid = None
         
         self.grid_columnconfigure((0, 1, 2, 3, 4, 5), weight=1, uniform="outlet")
         
         # Outlet title
         ctk.CTkLabel(
             self, text=f"{outlet_name} CONFIGURATION",
-            font=("Roboto", 13, "bold"),
-            text_color="#3498DB"
+            font=_font(13, "bold"),
+            text_color=COLOR_BLUE
         ).grid(row=0, column=0, columnspan=4, pady=(10, 5), padx=10, sticky="w")
         
         # Off-Grid Mode toggle (top right)
         self.offgrid_switch = ctk.CTkSwitch(
             self, text="Off-Grid Mode",
             variable=variables["off_grid_mode"],
-            font=("Roboto", 10, "bold")
+            font=_font(10, "bold")
         )
         self.offgrid_switch.grid(row=0, column=4, columnspan=2, sticky="e", padx=10, pady=(10, 5))
         
@@ -97,7 +219,7 @@ class OutletSettingsPanel(ctk.CTkFrame):
         self.soc_switch = ctk.CTkSwitch(
             self, text="SOC Trigger",
             variable=variables["soc_enabled"],
-            font=("Roboto", 10, "bold")
+            font=_font(10, "bold")
         )
         self.soc_switch.grid(row=1, column=0, sticky="w", padx=10, pady=10)
         
@@ -105,7 +227,7 @@ class OutletSettingsPanel(ctk.CTkFrame):
         self.on_grid_always_on_switch = ctk.CTkSwitch(
             self, text="On-Grid Always On",
             variable=variables["on_grid_always_on"],
-            font=("Roboto", 10, "bold")
+            font=_font(10, "bold")
         )
         self.on_grid_always_on_switch.grid(row=1, column=1, sticky="w", padx=0, pady=8)
         
@@ -117,8 +239,8 @@ class OutletSettingsPanel(ctk.CTkFrame):
         # Row 3: Headroom section (applies to all triggers)
         ctk.CTkLabel(
             self, text="Required Headroom:",
-            font=("Roboto", 10, "bold"),
-            text_color="#FFA500"
+            font=_font(10, "bold"),
+            text_color=COLOR_ORANGE
         ).grid(row=3, column=0, sticky="e", padx=5, pady=8)
         
         ctk.CTkEntry(
@@ -128,14 +250,14 @@ class OutletSettingsPanel(ctk.CTkFrame):
         
         ctk.CTkLabel(
             self, text="Available:",
-            font=("Roboto", 10, "bold"),
-            text_color="#FFA500"
+            font=_font(10, "bold"),
+            text_color=COLOR_ORANGE
         ).grid(row=3, column=2, sticky="e", padx=5, pady=8)
         
         self.lbl_headroom = ctk.CTkLabel(
             self, text="0 W",
-            font=("Roboto", 11, "bold"),
-            text_color="#2ECC71"
+            font=_font(11, "bold"),
+            text_color=COLOR_GREEN
         )
         self.lbl_headroom.grid(row=3, column=3, sticky="w", padx=5, pady=8)
         
@@ -143,7 +265,7 @@ class OutletSettingsPanel(ctk.CTkFrame):
         self.export_switch = ctk.CTkSwitch(
             self, text="Export Trigger",
             variable=variables["export_enabled"],
-            font=("Roboto", 10, "bold")
+            font=_font(10, "bold")
         )
         self.export_switch.grid(row=4, column=0, sticky="w", padx=10, pady=8)
         
@@ -154,13 +276,13 @@ class OutletSettingsPanel(ctk.CTkFrame):
         self.voltage_switch = ctk.CTkSwitch(
             self, text="Voltage Trigger",
             variable=variables["voltage_enabled"],
-            font=("Roboto", 10, "bold")
+            font=_font(10, "bold")
         )
         self.voltage_switch.grid(row=5, column=0, sticky="w", padx=10, pady=8)
         
         ctk.CTkLabel(
             self, text="Phase:",
-            font=("Roboto", 10, "bold")
+            font=_font(10, "bold")
         ).grid(row=5, column=1, sticky="e", padx=2, pady=8)
         
         self.phase_selector = ctk.CTkSegmentedButton(
@@ -184,55 +306,68 @@ class OutletSettingsPanel(ctk.CTkFrame):
         self.restart_delay_switch = ctk.CTkSwitch(
             self, text="Restart Delay",
             variable=variables["restart_delay_enabled"],
-            font=("Roboto", 10, "bold")
+            font=_font(10, "bold")
         )
         self.restart_delay_switch.grid(row=8, column=0, sticky="w", padx=10, pady=8)
         
         self._add_setting_h("Delay (min):", variables["restart_delay_minutes"], 8, 1)
+        self._logic_labels = tuple(self._logic_labels)
+        self._logic_entries = tuple(self._logic_entries)
     
     def update_headroom_status(self, available: int, required: int) -> None:
         """Update headroom status display with color coding."""
         if available >= required:
-            color = "#2ECC71"  # Green - sufficient
+            color = COLOR_GREEN  # Sufficient
             self.lbl_headroom.configure(text=f"{available} W", text_color=color)
         else:
-            color = "#E74C3C"  # Red - insufficient
+            color = COLOR_RED  # Insufficient
             self.lbl_headroom.configure(text=f"{available} W (need {required})", text_color=color)
     
     def _add_setting_v(self, label: str, var, row: int, col: int) -> None:
         """Add a vertical setting (label above entry)."""
-        lbl = ctk.CTkLabel(self, text=label, font=("Roboto", 10))
+        lbl = ctk.CTkLabel(self, text=label, font=_font(10))
         lbl.grid(row=row, column=col, pady=(0, 2))
         
         ent = ctk.CTkEntry(self, textvariable=var, width=85, justify="center")
         ent.grid(row=row + 1, column=col, padx=5, pady=(0, 10))
         
-        self.logic_widgets.append((lbl, ent))
+        self._logic_labels.append(lbl)
+        self._logic_entries.append(ent)
     
     def _add_setting_h(self, label: str, var, row: int, col: int, pady=8) -> None:
         """Add a horizontal setting (label left of entry)."""
-        lbl = ctk.CTkLabel(self, text=label, font=("Roboto", 10, "bold"))
+        lbl = ctk.CTkLabel(self, text=label, font=_font(10, "bold"))
         lbl.grid(row=row, column=col, sticky="e", padx=2, pady=pady)
         
         ent = ctk.CTkEntry(self, textvariable=var, width=75, justify="center")
         ent.grid(row=row, column=col + 1, sticky="w", padx=2, pady=pady)
         
-        self.logic_widgets.append((lbl, ent))
+        self._logic_labels.append(lbl)
+        self._logic_entries.append(ent)
     
     def set_manual_mode_visuals(self, is_manual: bool) -> None:
         """Update visuals based on manual mode state."""
-        color = "#E74C3C" if is_manual else "white"
-        state = "disabled" if is_manual else "normal"
-        
-        for lbl, ent in self.logic_widgets:
-            ent.configure(text_color=color, state=state)
-            lbl.configure(text_color=color)
+        if is_manual == self._last_manual:
+            return
+        self._last_manual = is_manual
+        
+        label_color = _MANUAL_COLORS[is_manual]
+        entry_color = _LOGIC_ENTRY_COLORS[is_manual, bool(self._last_invalid)]
+        state = _MANUAL_STATES[is_manual]
+        for ent in self._logic_entries:
+            ent.configure(text_color=entry_color, state=state)
+        for lbl in self._logic_labels:
+            lbl.configure(text_color=label_color)
     
     def set_invalid_config(self, is_invalid: bool) -> None:
         """Set visual indicator for invalid configuration."""
-        color = "#A569BD" if is_invalid else "white"
-        for _, ent in self.logic_widgets:
-            ent.configure(text_color=color)
+        if is_invalid == self._last_invalid:
+            return
+        self._last_invalid = is_invalid
+        
+        entry_color = _LOGIC_ENTRY_COLORS[bool(self._last_manual), is_invalid]
+        for ent in self._logic_entries:
+            ent.configure(text_color=entry_color)
 
 
 class SettingsPanel(ctk.CTkFrame):
@@ -247,7 +382,7 @@ class SettingsPanel(ctk.CTkFrame):
         # Title
         ctk.CTkLabel(
             self, text="GLOBAL SAFETY CONFIGURATION",
-            font=("Roboto", 14, "bold")
+            font=_font(14, "bold")
         ).grid(row=0, column=0, columnspan=6, pady=10)
         
         # Manual override switch
@@ -255,16 +390,16 @@ class SettingsPanel(ctk.CTkFrame):
             self, text="MANUAL OVERRIDE MODE",
             variable=variables["manual_mode"],
             command=on_manual_toggle,
-            progress_color="#E74C3C",
-            font=("Roboto", 12, "bold")
+            progress_color=COLOR_RED,
+            font=_font(12, "bold")
         )
         self.man_switch.grid(row=1, column=0, columnspan=6, pady=(0, 20))
         
         # Safety row
         ctk.CTkLabel(
             self, text="SAFETY:",
-            font=("Roboto", 11, "bold"),
-            text_color="#E74C3C"
+            font=_font(11, "bold"),
+            text_color=COLOR_RED
         ).grid(row=2, column=0, sticky="e", pady=20, padx=10)
         
         self._add_setting_h("Max Phase W:", variables["phase_max"], 2, 1, is_safety=True)
@@ -275,7 +410,7 @@ class SettingsPanel(ctk.CTkFrame):
 
     def _add_setting_h(self, label: str, var, row: int, col: int, is_safety: bool = False) -> None:
         """Add a horizontal setting (label left of entry)."""
-        lbl = ctk.CTkLabel(self, text=label, font=("Roboto", 11, "bold"))
+        lbl = ctk.CTkLabel(self, text=label, font=_font(11, "bold"))
         lbl.grid(row=row, column=col, sticky="e", padx=2)
         
         ent = ctk.CTkEntry(self, textvariable=var, width=75, justify="center")
@@ -286,9 +421,20 @@ class SettingsPanel(ctk.CTkFrame):
         pass
 
 
-class StatusHeader(ctk.CTkFrame):
+class StatusHeader(_Throttler, ctk.CTkFrame):
     """Header widget showing system status and main metrics."""
     
+    # Metric label templates, parsed once ({:+d} gives the explicit +/- sign)
+    _SOLAR_FMT = "SOLAR\n{}W".format
+    _SOLAR_GEN_FMT = "SOLAR\n{}W ({:+d}W)".format
+    _BATTERY_FMT = "BATTERY\n{}% ({}W)".format
+    _GRID_FMT = "GRID\n{}{}W".format
+    
+    # Display resolution (W) for solar output and grid power; those readings are
+    # rounded to it so single-watt polling jitter doesn't redraw the labels
+    _POWER_STEP = 5
+    _GRID_STEP = 10
+    
     def __init__(self, parent, bat_stats_command=None, **kwargs):
         super().__init__(parent, fg_color="transparent", **kwargs)
         
@@ -298,29 +444,29 @@ class StatusHeader(ctk.CTkFrame):
         # Status label
         self.lbl_status = ctk.CTkLabel(
             self, text="CONNECTING...",
-            font=("Roboto", 24, "bold")
+            font=_font(24, "bold")
         )
         self.lbl_status.grid(row=0, column=0, columnspan=3, pady=10)
         
         # Solar label
         self.lbl_solar = ctk.CTkLabel(
             self, text="SOLAR\n0W",
-            font=("Roboto", 22, "bold"),
-            text_color="#FFD700"
+            font=_font(22, "bold"),
+            text_color=COLOR_GOLD
         )
         self.lbl_solar.grid(row=1, column=0)
         
         # Battery/SOC label
         self.lbl_soc = ctk.CTkLabel(
             self, text="BATTERY\n0%",
-            font=("Roboto", 22, "bold")
+            font=_font(22, "bold")
         )
         self.lbl_soc.grid(row=1, column=1)
         
         # Grid label
         self.lbl_grid = ctk.CTkLabel(
             self, text="GRID\n0W",
-            font=("Roboto", 22, "bold")
+            font=_font(22, "bold")
         )
         self.lbl_grid.grid(row=1, column=2)
         
@@ -328,39 +474,76 @@ class StatusHeader(ctk.CTkFrame):
         self.btn_batstats = ctk.CTkButton(
             self, text="BatStats",
             command=bat_stats_command,
-            font=("Roboto", 14, "bold"),
+            font=_font(14, "bold"),
             width=90, height=36,
             fg_color="#2C3E50",
             hover_color="#34495E",
             corner_radius=8,
         )
         self.btn_batstats.grid(row=0, column=3, rowspan=2, padx=(10, 15), pady=10, sticky="ne")
+        
+        # Last inputs rendered by each updater; repeats skip the configure() redraw
+        self._last_status = None
+        self._last_solar = None
+        self._last_soc = None
+        self._last_grid = None
+        self._init_throttler()
 
     def update_status(self, text: str, color: str, is_grid_connected: bool = True) -> None:
         """Update the status label with grid connection status."""
-        grid_status = "ON-GRID" if is_grid_connected else "OFF-GRID"
-        grid_color = "#2ECC71" if is_grid_connected else "#E74C3C"
-        full_text = f"{text} - {grid_status}"
-        # Use the main color for status, grid status color is shown in the text
-        self.lbl_status.configure(text=full_text, text_color=grid_color)
+        self._defer(self._apply_status, text, color, is_grid_connected)
 
     def update_solar(self, power: int, gen_power: int = 0) -> None:
         """Update solar power display. Shows micro inverter contribution in brackets."""
-        if gen_power != 0:
-            sign = "+" if gen_power > 0 else ""
-            self.lbl_solar.configure(text=f"SOLAR\n{power}W ({sign}{gen_power}W)")
-        else:
-            self.lbl_solar.configure(text=f"SOLAR\n{power}W")
+        self._defer(self._apply_solar, power, gen_power)
 
     def update_battery(self, soc: int, power: int) -> None:
         """Update battery display."""
-        self.lbl_soc.configure(text=f"BATTERY\n{soc}% ({power}W)")
+        self._defer(self._apply_battery, soc, power)
 
     def update_grid(self, power: int) -> None:
         """Update grid power display."""
-        prefix = "+" if power >= 0 else ""
-        color = "#2ECC71" if power < 0 else "#AAAAAA"
-        self.lbl_grid.configure(text=f"GRID\n{prefix}{power}W", text_color=color)
+        self._defer(self._apply_grid, power)
+
+    def _apply_status(self, text: str, color: str, is_grid_connected: bool) -> None:
+        key = (text, color, is_grid_connected)
+        if key == self._last_status:
+            return
+        self._last_status = key
+        grid_status = "ON-GRID" if is_grid_connected else "OFF-GRID"
+        grid_color = COLOR_GREEN if is_grid_connected else COLOR_RED
+        full_text = f"{text} - {grid_status}"
+        # Use the main color for status, grid status color is shown in the text
+        self.lbl_status.configure(text=full_text, text_color=grid_color)
+
+    def _apply_solar(self, power: int, gen_power: int) -> None:
+        # Solar output is rounded; the generator contribution is shown to the watt
+        power = self._POWER_STEP * round(power / self._POWER_STEP)
+        key = (power, gen_power)
+        if key == self._last_solar:
+            return
+        self._last_solar = key
+        if gen_power != 0:
+            self.lbl_solar.configure(text=self._SOLAR_GEN_FMT(power, gen_power))
+        else:
+            self.lbl_solar.configure(text=self._SOLAR_FMT(power))
+
+    def _apply_battery(self, soc: int, power: int) -> None:
+        key = (soc, power)
+        if key == self._last_soc:
+            return
+        self._last_soc = key
+        self.lbl_soc.configure(text=self._BATTERY_FMT(soc, power))
+
+    def _apply_grid(self, power: int) -> None:
+        # Sign and colour follow the raw reading so a small export doesn't round to "+0"
+        exporting = power < 0
+        key = (exporting, self._GRID_STEP * round(abs(power) / self._GRID_STEP))
+        if key == self._last_grid:
+            return
+        self._last_grid = key
+        color = COLOR_GREEN if exporting else "#AAAAAA"
+        self.lbl_grid.configure(text=self._GRID_FMT("-" if exporting else "+", key[1]), text_color=color)
 
 
 class HeatPumpButton(ctk.CTkButton):
@@ -377,7 +560,7 @@ class HeatPumpButton(ctk.CTkButton):
         STATE_OFFLINE: "#3B3B3B",
         STATE_RUNNING: "#27AE60",
         STATE_STANDBY: "#C0392B",
-        STATE_SWITCHING: "#F39C12",
+        STATE_SWITCHING: COLOR_AMBER,
     }
     
     LABELS = {
@@ -393,7 +576,7 @@ class HeatPumpButton(ctk.CTkButton):
             parent,
             text=self.LABELS[self.STATE_SYNCING],
             command=command,
-            font=("Roboto", 20, "bold"),
+            font=_font(20, "bold"),
             height=70,
             hover=False,
             **kwargs
@@ -402,6 +585,8 @@ class HeatPumpButton(ctk.CTkButton):
 
     def set_state(self, state: str) -> None:
         """Set the button state."""
+        if state == self._current_state:
+            return
         if state in self.LABELS:
             self._current_state = state
             self.configure(
@@ -423,41 +608,58 @@ class OutletButton(ctk.CTkButton):
         STATE_OFFLINE: "#3B3B3B",
         STATE_RUNNING: "#27AE60",
         STATE_STANDBY: "#C0392B",
-        STATE_SWITCHING: "#F39C12",
+        STATE_SWITCHING: COLOR_AMBER,
+    }
+    
+    # RUNNING depends on the (mutable) power and is formatted separately
+    _TEMPLATES = {
+        STATE_SYNCING: "{name}: SYNCING",
+        STATE_OFFLINE: "{name}: OFFLINE",
+        STATE_RUNNING: None,
+        STATE_STANDBY: "{name}: OFF",
+        STATE_SWITCHING: "{name}: SWITCHING...",
     }
     
     def __init__(self, parent, outlet_name: str, power: int, command, **kwargs):
         self.outlet_name = outlet_name
         self.power = power
+        self._texts = {
+            state: template.format(name=outlet_name)
+            for state, template in self._TEMPLATES.items() if template is not None
+        }
+        self._running_fmt = f"{outlet_name}: ON ({{}}W)".format
+        self._running_text = (None, "")
         super().__init__(
             parent,
             text=self._format_text(self.STATE_SYNCING),
             command=command,
-            font=("Roboto", 16, "bold"),
+            font=_font(16, "bold"),
             height=60,
             hover=False,
             **kwargs
         )
         self._current_state = self.STATE_SYNCING
+        self._last_power = power
 
     def _format_text(self, state: str) -> str:
         """Format the button text based on state."""
-        if state == self.STATE_SYNCING:
-            return f"{self.outlet_name}: SYNCING"
-        elif state == self.STATE_OFFLINE:
-            return f"{self.outlet_name}: OFFLINE"
-        elif state == self.STATE_RUNNING:
-            return f"{self.outlet_name}: ON ({self.power}W)"
-        elif state == self.STATE_STANDBY:
-            return f"{self.outlet_name}: OFF"
-        elif state == self.STATE_SWITCHING:
-            return f"{self.outlet_name}: SWITCHING..."
-        return f"{self.outlet_name}"
+        text = self._texts.get(state)
+        if text is not None:
+            return text
+        if state == self.STATE_RUNNING:
+            if self._running_text[0] != self.power:
+                self._running_text = (self.power, self._running_fmt(self.power))
+            return self._running_text[1]
+        return self.outlet_name
 
     def set_state(self, state: str) -> None:
         """Set the button state."""
+        # RUNNING text includes the power, so a power change still redraws
+        if state == self._current_state and self.power == self._last_power:
+            return
         if state in self.COLORS:
             self._current_state = state
+            self._last_power = self.power
             self.configure(
                 text=self._format_text(state),
                 fg_color=self.COLORS[state]
@@ -475,15 +677,15 @@ class ErrorLogViewer(ctk.CTkScrollableFrame):
         # Title
         self.lbl_title = ctk.CTkLabel(
             self, text="System Log",
-            font=("Roboto", 12, "bold"),
-            text_color="#888888"
+            font=_font(12, "bold"),
+            text_color=COLOR_GRAY
         )
         self.lbl_title.grid(row=0, column=0, sticky="w", padx=10, pady=(5, 0))
         
         # Log container
         self.log_text = ctk.CTkTextbox(
             self, 
-            font=("Consolas", 10),
+            font=_font(10, family="Consolas"),
             fg_color="#0D0D0D",
             text_color="#00FF00",
             wrap="word",
@@ -494,34 +696,108 @@ class ErrorLogViewer(ctk.CTkScrollableFrame):
         self.grid_rowconfigure(1, weight=1)
         
         self._max_lines = 100
+        
+        # Entries added since the last flush; appended to the textbox on idle
+        self._pending = []
+        
+        # Timestamp text is rebuilt at most once per second
+        self._last_ts = None
+        self._last_ts_str = ""
     
     def add_log(self, message: str) -> None:
-        """Add a log message."""
-        import datetime
-        timestamp = datetime.datetime.now().strftime("%H:%M:%S")
-        log_entry = f"[{timestamp}] {message}\n"
-        
+        """Add a log message (shown on the next idle, so a burst redraws once)."""
+        now = int(time.time())
+        if now != self._last_ts:
+            self._last_ts = now
+            self._last_ts_str = time.strftime("%H:%M:%S", time.localtime(now))
+        if not self._pending:
+            self.after_idle(self._flush)
+        self._pending.append(f"[{self._last_ts_str}] {message}\n")
+    
+    def _flush(self) -> None:
+        """Append the entries added since the last flush and trim to _max_lines."""
+        if not self._pending:
+            return
+        pending, self._pending = self._pending[-self._max_lines:], []
         self.log_text.configure(state="normal")
-        self.log_text.insert("end", log_entry)
-        
-        # Auto-scroll to bottom
-        self.log_text.see("end")
+        self.log_text.insert("end", "".join(pending))
         
         # Limit number of lines
-        line_count = int(self.log_text.index("end-1c").split(".")[0])
-        if line_count > self._max_lines:
-            self.log_text.delete("1.0", f"{line_count - self._max_lines}.0")
+        self.log_text.delete("1.0", f"end-{self._max_lines + 1}l")
         
+        # Auto-scroll to bottom
+        self.log_text.see("end")
         self.log_text.configure(state="disabled")
     
     def clear_logs(self) -> None:
         """Clear all log messages."""
+        self._pending.clear()
         self.log_text.configure(state="normal")
         self.log_text.delete("1.0", "end")
         self.log_text.configure(state="disabled")
 
+# Combined schedule row fields: "HH:MM-HH:MM" time range and "MAX/GRID" charge amps
+_TIME_RANGE_RE = re.compile(r"(\d{1,2}):(\d{1,2})-(\d{1,2}):(\d{1,2})")
+_CHARGE_PAIR_RE = re.compile(r"(\d+)/(\d+)")
+_TIME_RANGE_CHARS = frozenset("0123456789:-")
+_CHARGE_PAIR_CHARS = frozenset("0123456789/")
+
+
+def _parse_time_range(text: str) -> Optional[Tuple[int, int, int, int]]:
+    """
+    Parse "HH:MM-HH:MM" into (start_hour, start_min, end_hour, end_min).
+    Returns None for a malformed or out-of-range time or an empty (start == end) range;
+    an end before the start is an overnight slot and is allowed.
+    """
+    match = _TIME_RANGE_RE.fullmatch(text.strip())
+    if match is None:
+        return None
+    start_hour, start_min, end_hour, end_min = map(int, match.groups())
+    if start_hour > 23 or end_hour > 23 or start_min > 59 or end_min > 59:
+        return None
+    if (start_hour, start_min) == (end_hour, end_min):
+        return None
+    return start_hour, start_min, end_hour, end_min
+
+
+def _parse_charge_pair(text: str) -> Optional[Tuple[int, int]]:
+    """Parse "MAX/GRID" charge amps into (max_charge, grid_charge); None if malformed."""
+    match = _CHARGE_PAIR_RE.fullmatch(text.strip())
+    if match is None:
+        return None
+    max_charge, grid_charge = map(int, match.groups())
+    return max_charge, grid_charge
+
+
+def _is_int_text(text: str) -> bool:
+    """True if ``int(text)`` would succeed."""
+    try:
+        int(text)
+    except ValueError:
+        return False
+    return True
+
+
 class TimeScheduleRow(ctk.CTkFrame):
     """A single row in the time schedule representing one time interval."""
+
+    # Left-to-right grid layout as (item, pad_left, pad_right). A string names an
+    # interactive widget attribute, a tuple is a caption label (text, color).
+    # Units are part of the captions, so there are no separate "A"/"%"/"W" labels.
+    _LAYOUT = (
+        ("chk_enabled", 5, 10),
+        (("Time (HH:MM-HH:MM):", None), 0, 2),
+        ("time_entry", 0, 0),
+        (("Charge MAX/GRID (A):", COLOR_GREEN), 50, 2),
+        ("charge_entry", 2, 20),
+        (("Max Discharge (A):", "#E67E22"), 30, 2),
+        ("max_discharge", 2, 10),
+        ("sw_sell", 15, 5),
+        (("Min batt %:", COLOR_RED), 5, 2),
+        ("min_batt_pct", 2, 10),
+        (("Sell Power (W):", COLOR_RED), 5, 2),
+        ("sell_power", 2, 5),
+    )
     
     def __init__(self, parent, index: int, on_delete: Callable, on_value_change: Callable = None, **kwargs):
         super().__init__(parent, fg_color="#2B2B2B", corner_radius=5, **kwargs)
@@ -532,7 +808,16 @@ class TimeScheduleRow(ctk.CTkFrame):
         # Track if fields have been modified (dirty flag)
         self._dirty = False
         
-        # Don't use weight on time columns to keep them compact
+        # Parsed get_schedule() result as (version, schedule); edits bump the version
+        self._version = 0
+        self._cached = (-1, None)
+        
+        # Text variables behind the entries; edit listeners trace their writes
+        self._entry_vars: List[ctk.StringVar] = []
+        
+        # Entries currently flagged red because their text doesn't parse
+        self._invalid_entries = set()
+        self._flags_pending = False
         
         # Enable checkbox
         self.enabled_var = ctk.BooleanVar(value=True)
@@ -541,97 +826,76 @@ class TimeScheduleRow(ctk.CTkFrame):
             variable=self.enabled_var,
             width=20
         )
-        self.chk_enabled.grid(row=0, column=0, padx=(5, 10), pady=8)
         
-        # Start time - grouped together
-        ctk.CTkLabel(self, text="From:", font=("Roboto", 10)).grid(row=0, column=1, padx=(0, 2), sticky="e")
-        self.start_hour = ctk.CTkEntry(self, width=40, justify="center", placeholder_text="HH")
-        self.start_hour.grid(row=0, column=2, padx=0)
-        self.start_hour.insert(0, "00")
-        
-        ctk.CTkLabel(self, text=":", font=("Roboto", 10, "bold")).grid(row=0, column=3, padx=0)
-        self.start_min = ctk.CTkEntry(self, width=40, justify="center", placeholder_text="MM")
-        self.start_min.grid(row=0, column=4, padx=0)
-        self.start_min.insert(0, "00")
-        
-        # End time - grouped together
-        ctk.CTkLabel(self, text="To:", font=("Roboto", 10)).grid(row=0, column=5, padx=(35, 2), sticky="e")
-        self.end_hour = ctk.CTkEntry(self, width=40, justify="center", placeholder_text="HH")
-        self.end_hour.grid(row=0, column=6, padx=0)
-        self.end_hour.insert(0, "23")
-        
-        ctk.CTkLabel(self, text=":", font=("Roboto", 10, "bold")).grid(row=0, column=7, padx=0)
-        self.end_min = ctk.CTkEntry(self, width=40, justify="center", placeholder_text="MM")
-        self.end_min.grid(row=0, column=8, padx=0)
-        self.end_min.insert(0, "59")
+        # Start-end time as one "HH:MM-HH:MM" entry (keystrokes limited to digits, ":" and "-")
+        self.time_entry = self._make_entry(
+            100, "00:00-23:59", validate="key",
+            validatecommand=(self.register(lambda P: set(P) <= _TIME_RANGE_CHARS), "%P")
+        )
         
-        # Max Charge Amps
-        ctk.CTkLabel(self, text="Max Charge:", font=("Roboto", 10), text_color="#2ECC71").grid(row=0, column=9, padx=(50, 2))
-        self.max_charge = ctk.CTkEntry(self, width=60, justify="center")
-        self.max_charge.grid(row=0, column=10, padx=2)
-        self.max_charge.insert(0, str(DEFAULT_MAX_CHARGE_AMPS))
-        self.max_charge.bind("<Key>", lambda e: self._mark_dirty())
-        self.max_charge.bind("<FocusOut>", lambda e: self._on_field_change())
-        ctk.CTkLabel(self, text="A", font=("Roboto", 10)).grid(row=0, column=11, padx=(0, 20))
-        
-        # Grid Charge Amps
-        ctk.CTkLabel(self, text="Grid Charge:", font=("Roboto", 10), text_color="#3498DB").grid(row=0, column=12, padx=(30, 2))
-        self.grid_charge = ctk.CTkEntry(self, width=60, justify="center")
-        self.grid_charge.grid(row=0, column=13, padx=2)
-        self.grid_charge.insert(0, str(DEFAULT_GRID_CHARGE_AMPS))
-        self.grid_charge.bind("<Key>", lambda e: self._mark_dirty())
-        self.grid_charge.bind("<FocusOut>", lambda e: self._on_field_change())
-        ctk.CTkLabel(self, text="A", font=("Roboto", 10)).grid(row=0, column=14, padx=(0, 20))
-        
-        # Max Discharge Amps
-        ctk.CTkLabel(self, text="Max Discharge:", font=("Roboto", 10), text_color="#E67E22").grid(row=0, column=15, padx=(30, 2))
-        self.max_discharge = ctk.CTkEntry(self, width=60, justify="center")
-        self.max_discharge.grid(row=0, column=16, padx=2)
-        self.max_discharge.insert(0, str(DEFAULT_MAX_DISCHARGE_AMPS))
-        self.max_discharge.bind("<Key>", lambda e: self._mark_dirty())
-        self.max_discharge.bind("<FocusOut>", lambda e: self._on_field_change())
-        ctk.CTkLabel(self, text="A", font=("Roboto", 10)).grid(row=0, column=17, padx=(0, 10))
+        # Max / grid charge amps as one "MAX/GRID" entry, then discharge amps
+        self.charge_entry = self._make_entry(
+            70, f"{DEFAULT_MAX_CHARGE_AMPS}/{DEFAULT_GRID_CHARGE_AMPS}", track_changes=True, validate="key",
+            validatecommand=(self.register(lambda P: set(P) <= _CHARGE_PAIR_CHARS), "%P")
+        )
+        self.max_discharge = self._make_entry(60, str(DEFAULT_MAX_DISCHARGE_AMPS), track_changes=True)
         
         # Battery SELL switch
         self.sell_var = ctk.BooleanVar(value=False)
         self.sw_sell = ctk.CTkSwitch(
             self, text="Battery SELL",
             variable=self.sell_var,
-            font=("Roboto", 10, "bold"),
-            text_color="#E74C3C",
+            font=_font(10, "bold"),
+            text_color=COLOR_RED,
             width=40,
             command=lambda: (self._mark_dirty(), self._on_field_change())
         )
-        self.sw_sell.grid(row=0, column=18, padx=(15, 5))
         
         # Min battery % (floor for battery sell — battery won't discharge below this SOC)
-        ctk.CTkLabel(self, text="Min batt %:", font=("Roboto", 10), text_color="#E74C3C").grid(row=0, column=19, padx=(5, 2))
-        self.min_batt_pct = ctk.CTkEntry(self, width=40, justify="center")
-        self.min_batt_pct.grid(row=0, column=20, padx=2)
-        self.min_batt_pct.insert(0, "20")
-        self.min_batt_pct.bind("<Key>", lambda e: self._mark_dirty())
-        self.min_batt_pct.bind("<FocusOut>", lambda e: self._on_field_change())
-        ctk.CTkLabel(self, text="%", font=("Roboto", 10)).grid(row=0, column=21, padx=(0, 10))
+        self.min_batt_pct = self._make_entry(40, "20", track_changes=True)
         
         # Max Sell Power (W)
-        ctk.CTkLabel(self, text="Sell Power:", font=("Roboto", 10), text_color="#E74C3C").grid(row=0, column=22, padx=(5, 2))
-        self.sell_power = ctk.CTkEntry(self, width=70, justify="center")
-        self.sell_power.grid(row=0, column=23, padx=2)
-        self.sell_power.insert(0, "0")
-        self.sell_power.bind("<Key>", lambda e: self._mark_dirty())
-        self.sell_power.bind("<FocusOut>", lambda e: self._on_field_change())
-        ctk.CTkLabel(self, text="W", font=("Roboto", 10)).grid(row=0, column=24, padx=(0, 5))
-        
-        # Add a spacer column to push delete button to the right
-        self.grid_columnconfigure(25, weight=1)
+        self.sell_power = self._make_entry(70, "0", track_changes=True)
         
         # Delete button
         self.btn_delete = ctk.CTkButton(
             self, text="✕", width=30, height=24,
-            fg_color="#E74C3C", hover_color="#C0392B",
+            fg_color=COLOR_RED, hover_color="#C0392B",
             command=lambda: self.on_delete(self.index)
         )
-        self.btn_delete.grid(row=0, column=26, padx=(5, 10))
+        
+        for column, (item, pad_left, pad_right) in enumerate(self._LAYOUT):
+            if isinstance(item, str):
+                widget = getattr(self, item)
+            else:
+                text, color = item
+                widget = ctk.CTkLabel(self, text=text, font=_font(10), text_color=color)
+            widget.grid(row=0, column=column, padx=(pad_left, pad_right), pady=8)
+        
+        # Spacer column pushes the delete button to the right
+        self.grid_columnconfigure(len(self._LAYOUT), weight=1)
+        self.btn_delete.grid(row=0, column=len(self._LAYOUT) + 1, padx=(5, 10))
+        
+        self._entry_text_color = self.time_entry.cget("text_color")
+        self.add_edit_listener(self._invalidate)
+        self.add_edit_listener(self._queue_field_flags)
+    
+    def _make_entry(self, width: int, value: str, track_changes: bool = False, **kwargs) -> ctk.CTkEntry:
+        """Create an entry on the row, backed by a text variable holding its initial value."""
+        var = ctk.StringVar(value=value)
+        self._entry_vars.append(var)
+        entry = ctk.CTkEntry(self, textvariable=var, width=width, justify="center", **kwargs)
+        if track_changes:
+            entry.bind("<Key>", lambda e: self._mark_dirty())
+            entry.bind("<FocusOut>", lambda e: self._on_field_change())
+        return entry
+    
+    def add_edit_listener(self, callback: Callable) -> None:
+        """Call ``callback()`` whenever any field of this row changes (typed, pasted or set)."""
+        for var in self._entry_vars:
+            var.trace_add("write", lambda *_: callback())
+        self.enabled_var.trace_add("write", lambda *_: callback())
+        self.sell_var.trace_add("write", lambda *_: callback())
     
     def _mark_dirty(self) -> None:
         """Mark this row as having been edited."""
@@ -643,66 +907,127 @@ class TimeScheduleRow(ctk.CTkFrame):
             self._dirty = False
             self.on_value_change()
     
-    def get_schedule(self) -> dict:
-        """Get the schedule data from this row."""
+    def _invalidate(self) -> None:
+        """Drop the parsed schedule after a field changed."""
+        self._version += 1
+    
+    def _queue_field_flags(self) -> None:
+        """Re-check the field flags on the next idle (a burst of writes checks once)."""
+        if not self._flags_pending:
+            self._flags_pending = True
+            self.after_idle(self._refresh_field_flags)
+    
+    def _refresh_field_flags(self) -> None:
+        """
+        Colour entries red while their text doesn't parse, since such a row drops out
+        of the schedule; restore the normal colour once it parses again.
+        """
+        self._flags_pending = False
+        if not self.winfo_exists():
+            return  # row was deleted before the idle callback ran
+        checks = (
+            (self.time_entry, _parse_time_range(self.time_entry.get()) is not None),
+            (self.charge_entry, _parse_charge_pair(self.charge_entry.get()) is not None),
+            (self.max_discharge, _is_int_text(self.max_discharge.get())),
+            (self.min_batt_pct, _is_int_text(self.min_batt_pct.get())),
+            (self.sell_power, _is_int_text(self.sell_power.get())),
+        )
+        for entry, valid in checks:
+            if valid == (entry not in self._invalid_entries):
+                continue
+            if valid:
+                self._invalid_entries.discard(entry)
+                entry.configure(text_color=self._entry_text_color)
+            else:
+                self._invalid_entries.add(entry)
+                entry.configure(text_color=COLOR_RED)
+    
+    def get_schedule(self) -> Optional[ScheduleSlot]:
+        """Get the schedule slot from this row (parsed once per edit, then shared)."""
+        version, schedule = self._cached
+        if version == self._version:
+            return schedule
+        version = self._version
+        schedule = self._parse_schedule()
+        self._cached = (version, schedule)
+        return schedule
+    
+    def _parse_schedule(self) -> Optional[ScheduleSlot]:
+        """Parse the row's fields; None if the time or charge format or any number is invalid."""
+        time_range = _parse_time_range(self.time_entry.get())
+        charges = _parse_charge_pair(self.charge_entry.get())
+        if time_range is None or charges is None:
+            return None
+        start_hour, start_min, end_hour, end_min = time_range
+        max_charge, grid_charge = charges
         try:
-            return {
-                "enabled": self.enabled_var.get(),
-                "start_hour": int(self.start_hour.get()),
-                "start_min": int(self.start_min.get()),
-                "end_hour": int(self.end_hour.get()),
-                "end_min": int(self.end_min.get()),
-                "max_charge_amps": int(self.max_charge.get()),
-                "grid_charge_amps": int(self.grid_charge.get()),
-                "max_discharge_amps": int(self.max_discharge.get()),
-                "sell": self.sell_var.get(),
-                "sell_power": int(self.sell_power.get()),
-                "min_batt_pct": int(self.min_batt_pct.get()),
-            }
+            return ScheduleSlot(
+                enabled=self.enabled_var.get(),
+                start_hour=start_hour,
+                start_min=start_min,
+                end_hour=end_hour,
+                end_min=end_min,
+                max_charge_amps=max_charge,
+                grid_charge_amps=grid_charge,
+                max_discharge_amps=int(self.max_discharge.get()),
+                sell=self.sell_var.get(),
+                sell_power=int(self.sell_power.get()),
+                min_batt_pct=int(self.min_batt_pct.get()),
+            )
         except ValueError:
             return None
     
-    def set_schedule(self, data: dict) -> None:
+    def set_schedule(self, slot: ScheduleSlot) -> None:
         """Set the schedule data for this row."""
-        self.enabled_var.set(data.get("enabled", True))
-        
-        self.start_hour.delete(0, "end")
-        self.start_hour.insert(0, str(data.get("start_hour", 0)).zfill(2))
+        self.enabled_var.set(slot.enabled)
         
-        self.start_min.delete(0, "end")
-        self.start_min.insert(0, str(data.get("start_min", 0)).zfill(2))
-        
-        self.end_hour.delete(0, "end")
-        self.end_hour.insert(0, str(data.get("end_hour", 23)).zfill(2))
+        self.time_entry.delete(0, "end")
+        self.time_entry.insert(0, "-".join((
+            _hhmm(slot.start_hour, slot.start_min),
+            _hhmm(slot.end_hour, slot.end_min),
+        )))
         
-        self.end_min.delete(0, "end")
-        self.end_min.insert(0, str(data.get("end_min", 59)).zfill(2))
-        
-        self.max_charge.delete(0, "end")
-        self.max_charge.insert(0, str(data.get("max_charge_amps", DEFAULT_MAX_CHARGE_AMPS)))
-        
-        self.grid_charge.delete(0, "end")
-        self.grid_charge.insert(0, str(data.get("grid_charge_amps", DEFAULT_GRID_CHARGE_AMPS)))
+        self.charge_entry.delete(0, "end")
+        self.charge_entry.insert(0, "{}/{}".format(slot.max_charge_amps, slot.grid_charge_amps))
         
         self.max_discharge.delete(0, "end")
-        self.max_discharge.insert(0, str(data.get("max_discharge_amps", DEFAULT_MAX_DISCHARGE_AMPS)))
+        self.max_discharge.insert(0, str(slot.max_discharge_amps))
         
-        self.sell_var.set(data.get("sell", False))
+        self.sell_var.set(slot.sell)
         
         self.sell_power.delete(0, "end")
-        self.sell_power.insert(0, str(data.get("sell_power", 0)))
+        self.sell_power.insert(0, str(slot.sell_power))
 
         self.min_batt_pct.delete(0, "end")
-        self.min_batt_pct.insert(0, str(data.get("min_batt_pct", 20)))
+        self.min_batt_pct.insert(0, str(slot.min_batt_pct))
+        self._invalidate()
 
 
-class TimeSchedulePanel(ctk.CTkFrame):
+class TimeSchedulePanel(_Throttler, ctk.CTkFrame):
     """Panel for configuring time-based charge schedules."""
     
+    # Status label (text, color) for the fixed states and the active slot template
+    _STATUS_ENABLED = ("Active", COLOR_GREEN)
+    _STATUS_DISABLED = ("Disabled", COLOR_TK_GRAY)
+    _STATUS_NO_SLOT = ("No active slot (using defaults)", COLOR_AMBER)
+    _ACTIVE_FMT = "Active: {}-{} | Max:{}A Grid:{}A Discharge:{}A{}".format
+    # Slot fields the status text depends on, fetched in one call
+    _STATUS_FIELDS = attrgetter(
+        "start_hour", "start_min", "end_hour", "end_min",
+        "max_charge_amps", "grid_charge_amps", "max_discharge_amps", "sell", "sell_power"
+    )
+    
     def __init__(self, parent, on_schedule_change: Callable = None, **kwargs):
         super().__init__(parent, fg_color="#1E1E1E", corner_radius=10, border_width=1, border_color="#333333", **kwargs)
         self.on_schedule_change = on_schedule_change
         self.schedule_rows: List[TimeScheduleRow] = []
+        self._init_throttler()
+        
+        # Parsed (start_min, end_min, schedule) for enabled rows, rebuilt after edits.
+        # The version is bumped on the UI thread and checked by get_active_schedule()
+        # on the worker thread, so a rebuild racing an edit is simply redone.
+        self._sched_version = 0
+        self._sched_table = (-1, ())
         
         self.grid_columnconfigure(0, weight=1)
         
@@ -713,8 +1038,8 @@ class TimeSchedulePanel(ctk.CTkFrame):
         
         ctk.CTkLabel(
             header_frame, text="⏰ CHARGE / SELL SCHEDULE",
-            font=("Roboto", 14, "bold"),
-            text_color="#F39C12"
+            font=_font(14, "bold"),
+            text_color=COLOR_AMBER
         ).grid(row=0, column=0, sticky="w")
         
         # Enable/Disable switch
@@ -722,18 +1047,40 @@ class TimeSchedulePanel(ctk.CTkFrame):
         self.enable_switch = ctk.CTkSwitch(
             header_frame, text="Enable Schedule",
             variable=self.enabled_var,
-            font=("Roboto", 11, "bold"),
+            font=_font(11, "bold"),
             command=self._on_enable_toggle
         )
         self.enable_switch.grid(row=0, column=1, padx=20)
+        # Mirror the switch in a plain attribute so per-tick reads skip Tcl
+        self._enabled = True
+        self.enabled_var.trace_add("write", self._on_enabled_write)
         
         # Status label
         self.lbl_status = ctk.CTkLabel(
             header_frame, text="Active",
-            font=("Roboto", 11),
-            text_color="#2ECC71"
+            font=_font(11),
+            text_color=COLOR_GREEN
         )
         self.lbl_status.grid(row=0, column=2, sticky="e", padx=10)
+        self._status_state = self._STATUS_ENABLED
+        self._last_status_key = None
+        
+        # Defaults are kept parsed; each entry's variable re-parses its field when written
+        self._default_values_cache = {
+            "max_charge_amps": DEFAULT_MAX_CHARGE_AMPS,
+            "grid_charge_amps": DEFAULT_GRID_CHARGE_AMPS,
+            "max_discharge_amps": DEFAULT_MAX_DISCHARGE_AMPS,
+            "sell": False,
+            "sell_power": 0,
+            "min_batt_pct": 20,
+        }
+        self._defaults_view = MappingProxyType(dict(self._default_values_cache))
+        self._default_vars = {
+            key: ctk.StringVar(value=str(self._default_values_cache[key]))
+            for key in ("max_charge_amps", "grid_charge_amps", "max_discharge_amps")
+        }
+        for key, var in self._default_vars.items():
+            var.trace_add("write", lambda *_, key=key: self._on_default_change(key))
         
         # Default values frame (shown when disabled)
         self.defaults_frame = ctk.CTkFrame(header_frame, fg_color="#2B2B2B", corner_radius=5)
@@ -741,53 +1088,53 @@ class TimeSchedulePanel(ctk.CTkFrame):
         
         ctk.CTkLabel(
             self.defaults_frame, text="Defaults:",
-            font=("Roboto", 10, "bold"),
-            text_color="#888888"
+            font=_font(10, "bold"),
+            text_color=COLOR_GRAY
         ).grid(row=0, column=0, padx=(8, 5), pady=5)
         
         ctk.CTkLabel(
             self.defaults_frame, text="Max:",
-            font=("Roboto", 10),
-            text_color="#2ECC71"
+            font=_font(10),
+            text_color=COLOR_GREEN
         ).grid(row=0, column=1, padx=2, pady=5)
         
-        self.default_max_charge = ctk.CTkEntry(self.defaults_frame, width=45, justify="center")
+        self.default_max_charge = ctk.CTkEntry(self.defaults_frame, width=45, justify="center",
+                                               textvariable=self._default_vars["max_charge_amps"])
         self.default_max_charge.grid(row=0, column=2, padx=2, pady=5)
-        self.default_max_charge.insert(0, str(DEFAULT_MAX_CHARGE_AMPS))
         
         ctk.CTkLabel(
             self.defaults_frame, text="A",
-            font=("Roboto", 10)
+            font=_font(10)
         ).grid(row=0, column=3, padx=(0, 8), pady=5)
         
         ctk.CTkLabel(
             self.defaults_frame, text="Grid:",
-            font=("Roboto", 10),
-            text_color="#3498DB"
+            font=_font(10),
+            text_color=COLOR_BLUE
         ).grid(row=0, column=4, padx=2, pady=5)
         
-        self.default_grid_charge = ctk.CTkEntry(self.defaults_frame, width=45, justify="center")
+        self.default_grid_charge = ctk.CTkEntry(self.defaults_frame, width=45, justify="center",
+                                               textvariable=self._default_vars["grid_charge_amps"])
         self.default_grid_charge.grid(row=0, column=5, padx=2, pady=5)
-        self.default_grid_charge.insert(0, str(DEFAULT_GRID_CHARGE_AMPS))
         
         ctk.CTkLabel(
             self.defaults_frame, text="A",
-            font=("Roboto", 10)
+            font=_font(10)
         ).grid(row=0, column=6, padx=(0, 8), pady=5)
         
         ctk.CTkLabel(
             self.defaults_frame, text="Discharge:",
-            font=("Roboto", 10),
+            font=_font(10),
             text_color="#E67E22"
         ).grid(row=0, column=7, padx=2, pady=5)
         
-        self.default_max_discharge = ctk.CTkEntry(self.defaults_frame, width=45, justify="center")
+        self.default_max_discharge = ctk.CTkEntry(self.defaults_frame, width=45, justify="center",
+                                               textvariable=self._default_vars["max_discharge_amps"])
         self.default_max_discharge.grid(row=0, column=8, padx=2, pady=5)
-        self.default_max_discharge.insert(0, str(DEFAULT_MAX_DISCHARGE_AMPS))
         
         ctk.CTkLabel(
             self.defaults_frame, text="A",
-            font=("Roboto", 10)
+            font=_font(10)
         ).grid(row=0, column=9, padx=(0, 8), pady=5)
         
         # Add button
@@ -807,22 +1154,32 @@ class TimeSchedulePanel(ctk.CTkFrame):
         # Info label
         self.lbl_info = ctk.CTkLabel(
             self, text="Add time slots to automatically adjust charge settings during specific hours.",
-            font=("Roboto", 10),
-            text_color="#888888"
+            font=_font(10),
+            text_color=COLOR_GRAY
         )
         self.lbl_info.grid(row=2, column=0, pady=(5, 10))
         
         # Add default schedule rows from .env (SCHEDULE_N variables)
-        for sched in default_schedules:
+        self.bulk_load_schedules(default_schedules)
+    
+    def bulk_load_schedules(self, schedules: List[ScheduleSlot]) -> None:
+        """Append a row per schedule slot, then mark the parsed schedule table stale once."""
+        for sched in schedules:
             self._add_row()
             self.schedule_rows[-1].set_schedule(sched)
+        self._invalidate_sched_cache()
+    
+    def _invalidate_sched_cache(self) -> None:
+        """Mark the parsed schedule table stale after a row was added, removed or edited."""
+        self._sched_version += 1
+    
+    def _on_enabled_write(self, *_) -> None:
+        self._enabled = bool(self.enabled_var.get())
     
     def _on_enable_toggle(self) -> None:
         """Handle enable/disable toggle."""
-        if self.enabled_var.get():
-            self.lbl_status.configure(text="Active", text_color="#2ECC71")
-        else:
-            self.lbl_status.configure(text="Disabled", text_color="gray")
+        self._last_status_key = None
+        self._set_status(self._STATUS_ENABLED if self._enabled else self._STATUS_DISABLED)
         
         if self.on_schedule_change:
             self.on_schedule_change()
@@ -830,7 +1187,7 @@ class TimeSchedulePanel(ctk.CTkFrame):
     def _on_row_value_change(self) -> None:
         """Called when a row value changes (field loses focus)."""
         # Only trigger re-evaluation if schedule is enabled
-        if self.enabled_var.get() and self.on_schedule_change:
+        if self._enabled and self.on_schedule_change:
             self.on_schedule_change()
     
     def _add_row(self) -> None:
@@ -838,7 +1195,9 @@ class TimeSchedulePanel(ctk.CTkFrame):
         index = len(self.schedule_rows)
         row = TimeScheduleRow(self.rows_container, index, self._delete_row, on_value_change=self._on_row_value_change)
         row.grid(row=index, column=0, sticky="ew", pady=3)
+        row.add_edit_listener(self._invalidate_sched_cache)
         self.schedule_rows.append(row)
+        self._invalidate_sched_cache()
         
         # Hide info label when we have rows
         if self.schedule_rows:
@@ -849,11 +1208,13 @@ class TimeSchedulePanel(ctk.CTkFrame):
         if 0 <= index < len(self.schedule_rows):
             self.schedule_rows[index].destroy()
             self.schedule_rows.pop(index)
+            self._invalidate_sched_cache()
             
-            # Re-index remaining rows
-            for i, row in enumerate(self.schedule_rows):
+            # Re-index the rows that moved up; earlier rows keep their grid slot
+            for i in range(index, len(self.schedule_rows)):
+                row = self.schedule_rows[i]
                 row.index = i
-                row.grid(row=i, column=0, sticky="ew", pady=3)
+                row.grid_configure(row=i)
         
         # Show info label if no rows
         if not self.schedule_rows:
@@ -861,28 +1222,24 @@ class TimeSchedulePanel(ctk.CTkFrame):
     
     def is_enabled(self) -> bool:
         """Check if scheduling is enabled."""
-        return self.enabled_var.get()
+        return self._enabled
     
-    def get_active_schedule(self) -> dict:
+    def get_active_schedule(self) -> Optional[ScheduleSlot]:
         """
         Get the currently active schedule based on current time.
         Returns None if no schedule is active or scheduling is disabled.
         """
-        if not self.enabled_var.get():
+        if not self._enabled:
             return None
         
-        import datetime
         now = datetime.datetime.now()
         current_minutes = now.hour * 60 + now.minute
         
-        for row in self.schedule_rows:
-            schedule = row.get_schedule()
-            if schedule is None or not schedule["enabled"]:
-                continue
-            
-            start_minutes = schedule["start_hour"] * 60 + schedule["start_min"]
-            end_minutes = schedule["end_hour"] * 60 + schedule["end_min"]
-            
+        version, table = self._sched_table
+        if version != self._sched_version:
+            table = self._build_sched_table()
+        
+        for start_minutes, end_minutes, schedule in table:
             # Handle overnight schedules (e.g., 22:00 to 06:00)
             if start_minutes <= end_minutes:
                 # Normal case: same day
@@ -895,7 +1252,24 @@ class TimeSchedulePanel(ctk.CTkFrame):
         
         return None
     
-    def get_all_schedules(self) -> List[dict]:
+    def _build_sched_table(self) -> tuple:
+        """Parse the enabled rows into (start_min, end_min, schedule) tuples and cache them."""
+        version = self._sched_version
+        table = []
+        for row in self.schedule_rows:
+            schedule = row.get_schedule()
+            if schedule is None or not schedule.enabled:
+                continue
+            start_minutes = schedule.start_hour * 60 + schedule.start_min
+            end_minutes = schedule.end_hour * 60 + schedule.end_min
+            # Status text is rendered once per edit, before the table is published
+            schedule.display_text = self._format_active(schedule)
+            table.append((start_minutes, end_minutes, schedule))
+        table = tuple(table)
+        self._sched_table = (version, table)
+        return table
+    
+    def get_all_schedules(self) -> List[ScheduleSlot]:
         """Get all schedule configurations."""
         schedules = []
         for row in self.schedule_rows:
@@ -904,34 +1278,78 @@ class TimeSchedulePanel(ctk.CTkFrame):
                 schedules.append(schedule)
         return schedules
     
-    def get_default_values(self) -> dict:
-        """Get the default charge values to apply when no schedule is active."""
-        try:
-            return {
-                "max_charge_amps": int(self.default_max_charge.get()),
-                "grid_charge_amps": int(self.default_grid_charge.get()),
-                "max_discharge_amps": int(self.default_max_discharge.get()),
-                "sell": False,
-                "sell_power": 0,
-                "min_batt_pct": 20,
-            }
-        except ValueError:
-            return {"max_charge_amps": 60, "grid_charge_amps": 40, "max_discharge_amps": 150, "sell": False, "sell_power": 0, "min_batt_pct": 20}
+    def _on_default_change(self, key: str) -> None:
+        """Re-parse one default after its entry changed; an unparsable value keeps the last one."""
+        text = self._default_vars[key].get().strip()
+        if not text.isdecimal():
+            return
+        value = int(text)
+        if value != self._default_values_cache[key]:
+            self._default_values_cache[key] = value
+            self._defaults_view = MappingProxyType(dict(self._default_values_cache))
     
-    def update_status(self, active_schedule: dict = None) -> None:
-        """Update the status label to show current state."""
-        if not self.enabled_var.get():
-            self.lbl_status.configure(text="Disabled", text_color="gray")
+    def get_default_values(self) -> Mapping:
+        """
+        Get the default charge values to apply when no schedule is active.
+        Returns a shared read-only snapshot, replaced whenever a default is committed.
+        """
+        return self._defaults_view
+    
+    def update_status(self, active_schedule: Optional[ScheduleSlot] = None) -> None:
+        """Update the status label to show current state (applied on the next idle)."""
+        self._defer(self._apply_status, active_schedule)
+    
+    def _apply_status(self, active_schedule: Optional[ScheduleSlot]) -> None:
+        enabled = self._enabled
+        key = (enabled, id(active_schedule), active_schedule and self._STATUS_FIELDS(active_schedule))
+        if key == self._last_status_key:
+            return
+        self._last_status_key = key
+        
+        if not enabled:
+            self._set_status(self._STATUS_DISABLED)
         elif active_schedule:
-            start = f"{active_schedule['start_hour']:02d}:{active_schedule['start_min']:02d}"
-            end = f"{active_schedule['end_hour']:02d}:{active_schedule['end_min']:02d}"
-            sell_info = f" Sell:{active_schedule['sell_power']}W" if active_schedule.get('sell') else ""
-            self.lbl_status.configure(
-                text=f"Active: {start}-{end} | Max:{active_schedule['max_charge_amps']}A Grid:{active_schedule['grid_charge_amps']}A Discharge:{active_schedule['max_discharge_amps']}A{sell_info}",
-                text_color="#2ECC71"
-            )
+            text = active_schedule.display_text or self._format_active(active_schedule)
+            self._set_status((text, COLOR_GREEN))
         else:
-            self.lbl_status.configure(text="No active slot (using defaults)", text_color="#F39C12")
+            self._set_status(self._STATUS_NO_SLOT)
+    
+    def _format_active(self, schedule: ScheduleSlot) -> str:
+        """Render the status text for an active slot."""
+        (start_hour, start_min, end_hour, end_min,
+         max_charge, grid_charge, max_discharge, sell, sell_power) = self._STATUS_FIELDS(schedule)
+        sell_info = f" Sell:{sell_power}W" if sell else ""
+        return self._ACTIVE_FMT(
+            _hhmm(start_hour, start_min), _hhmm(end_hour, end_min),
+            max_charge, grid_charge, max_discharge, sell_info
+        )
+    
+    def _set_status(self, state: Tuple[str, str]) -> None:
+        """Apply a (text, color) status, skipping the configure call when nothing changed."""
+        if state != self._status_state:
+            self._status_state = state
+            self.lbl_status.configure(text=state[0], text_color=state[1])
+
+
+# Export load color bands: <= 85% gray, <= 95% amber, above that red
+_POWER_THRESHOLDS = (85, 95)
+_POWER_COLORS = (COLOR_GRAY, COLOR_AMBER, COLOR_RED)
+
+
+def _export_band(export_power: int, max_sell: int) -> Tuple[int, str]:
+    """
+    Return the rounded export percentage and its colour. The band compares the
+    exact ratio (export_power * 100 against the thresholds scaled by max_sell).
+    """
+    if max_sell <= 0:
+        return 0, _POWER_COLORS[0]
+    scaled = export_power * 100
+    bands = (_POWER_THRESHOLDS[0] * max_sell, _POWER_THRESHOLDS[1] * max_sell)
+    return round(scaled / max_sell), _POWER_COLORS[bisect_left(bands, scaled)]
+
+
+# Partial numeric input allowed while typing: "", "12", "12.", ".5", "12.5"
+_NUMERIC_INPUT_RE = re.compile(r"\d*\.?\d*")
 
 
 class OverpowerProtectionPanel(ctk.CTkFrame):
@@ -945,10 +1363,41 @@ class OverpowerProtectionPanel(ctk.CTkFrame):
     This helps prevent inverter shutdown due to grid overvoltage or power limits.
     """
     
+    # (entry attribute, settings key, parser) for the values cached by get_settings()
+    _SETTING_FIELDS = (
+        ("max_sell_power", "max_sell_power", int),
+        ("power_threshold", "power_threshold_pct", int),
+        ("recovery_threshold", "recovery_threshold_pct", int),
+        ("voltage_warning", "voltage_warning", float),
+        ("voltage_recovery", "voltage_recovery", float),
+        ("voltage_hold_margin", "voltage_hold_margin", float),
+        ("charge_step", "charge_step", int),
+    )
+    _SETTING_BY_ATTR = {attr: (key, parse) for attr, key, parse in _SETTING_FIELDS}
+    
+    # State label templates, parsed once
+    _POWER_FMT = "Export: {} W / {} W ({}%)".format
+    _VOLT_FMT = "Max Voltage: {:.1f} V".format
+    
+    # Minimum seconds between state display renders (caps it at ~10 Hz)
+    _STATE_MIN_INTERVAL = 0.1
+    
     def __init__(self, parent, on_settings_change: Callable = None, **kwargs):
         super().__init__(parent, fg_color="#1E1E1E", corner_radius=10, border_width=1, border_color="#333333", **kwargs)
         self.on_settings_change = on_settings_change
         
+        # Last (text, color) rendered per state label, see _set_label()
+        self._label_state = {}
+        
+        # Latest state display values waiting for the idle flush
+        self._pending_state = None
+        self._state_scheduled = False
+        self._last_state_ts = 0.0
+        
+        # Label writes made inside batched_updates(), applied when the outermost batch exits
+        self._batch_depth = 0
+        self._dirty_labels = {}
+        
         self.grid_columnconfigure(0, weight=1)
         
         # Header
@@ -958,8 +1407,8 @@ class OverpowerProtectionPanel(ctk.CTkFrame):
         
         ctk.CTkLabel(
             header_frame, text="⚡ BATTERY BOOST PROTECTION",
-            font=("Roboto", 14, "bold"),
-            text_color="#E74C3C"
+            font=_font(14, "bold"),
+            text_color=COLOR_RED
         ).grid(row=0, column=0, sticky="w")
         
         # Enable/Disable switch
@@ -967,7 +1416,7 @@ class OverpowerProtectionPanel(ctk.CTkFrame):
         self.enable_switch = ctk.CTkSwitch(
             header_frame, text="Enable Protection",
             variable=self.enabled_var,
-            font=("Roboto", 11, "bold"),
+            font=_font(11, "bold"),
             command=self._on_enable_toggle
         )
         self.enable_switch.grid(row=0, column=1, padx=20)
@@ -976,10 +1425,11 @@ class OverpowerProtectionPanel(ctk.CTkFrame):
         
         # Status label
         _startup_enabled = protection_config.enabled_at_startup
+        self._status_var = ctk.StringVar(value="Active" if _startup_enabled else "Disabled")
         self.lbl_status = ctk.CTkLabel(
-            header_frame, text="Active" if _startup_enabled else "Disabled",
-            font=("Roboto", 11),
-            text_color="#2ECC71" if _startup_enabled else "gray"
+            header_frame, textvariable=self._status_var,
+            font=_font(11),
+            text_color=COLOR_GREEN if _startup_enabled else COLOR_TK_GRAY
         )
         self.lbl_status.grid(row=0, column=2, sticky="e", padx=10)
         
@@ -988,50 +1438,55 @@ class OverpowerProtectionPanel(ctk.CTkFrame):
         settings_frame.grid(row=1, column=0, sticky="ew", padx=10, pady=5)
         settings_frame.grid_columnconfigure((1, 3, 5, 7, 9), weight=1)
         
+        # Reject non-numeric keystrokes up front so committed values always parse
+        vcmd = (self.register(self._is_numeric_input), "%P")
+        
         # Max Sell Power (W)
         ctk.CTkLabel(
             settings_frame, text="Max Sell Power:",
-            font=("Roboto", 10, "bold"),
-            text_color="#E74C3C"
+            font=_font(10, "bold"),
+            text_color=COLOR_RED
         ).grid(row=0, column=0, padx=(10, 5), pady=8, sticky="w")
         
-        self.max_sell_power = ctk.CTkEntry(settings_frame, width=70, justify="center")
+        self.max_sell_power = ctk.CTkEntry(settings_frame, width=70, justify="center", validate="key", validatecommand=vcmd)
         self.max_sell_power.grid(row=0, column=1, padx=5, pady=8)
         self.max_sell_power.insert(0, str(protection_config.max_sell_power))
         
-        ctk.CTkLabel(settings_frame, text="W", font=("Roboto", 10)).grid(row=0, column=2, padx=(0, 10), pady=8)
+        ctk.CTkLabel(settings_frame, text="W", font=_font(10)).grid(row=0, column=2, padx=(0, 10), pady=8)
         
         # Power threshold (%)
         ctk.CTkLabel(
             settings_frame, text="Power Threshold:",
-            font=("Roboto", 10),
-            text_color="#F39C12"
+            font=_font(10),
+            text_color=COLOR_AMBER
         ).grid(row=0, column=3, padx=5, pady=8, sticky="w")
         
-        self.power_threshold = ctk.CTkEntry(settings_frame, width=50, justify="center")
+        self.power_threshold = ctk.CTkEntry(settings_frame, width=50, justify="center", validate="key", validatecommand=vcmd)
         self.power_threshold.grid(row=0, column=4, padx=5, pady=8)
         self.power_threshold.insert(0, str(protection_config.power_threshold_pct))
         
-        ctk.CTkLabel(settings_frame, text="%", font=("Roboto", 10)).grid(row=0, column=5, padx=(0, 10), pady=8)
+        ctk.CTkLabel(settings_frame, text="%", font=_font(10)).grid(row=0, column=5, padx=(0, 10), pady=8)
         
         # Voltage warning threshold (V)
         ctk.CTkLabel(
             settings_frame, text="Voltage Warning:",
-            font=("Roboto", 10),
-            text_color="#F39C12"
+            font=_font(10),
+            text_color=COLOR_AMBER
         ).grid(row=0, column=6, padx=5, pady=8, sticky="w")
         
-        self.voltage_warning = ctk.CTkEntry(settings_frame, width=60, justify="center")
+        self.voltage_warning = ctk.CTkEntry(settings_frame, width=60, justify="center", validate="key", validatecommand=vcmd)
         self.voltage_warning.grid(row=0, column=7, padx=5, pady=8)
         self.voltage_warning.insert(0, str(protection_config.voltage_warning))
         self.voltage_warning.bind("<FocusOut>", self._on_warning_changed)
+        self.voltage_warning.bind("<KeyRelease>", self._cache_voltage_warning)
+        self._voltage_warning_cached = protection_config.voltage_warning
         
-        ctk.CTkLabel(settings_frame, text="V", font=("Roboto", 10)).grid(row=0, column=8, padx=(0, 10), pady=8)
+        ctk.CTkLabel(settings_frame, text="V", font=_font(10)).grid(row=0, column=8, padx=(0, 10), pady=8)
         
         # Adjustment interval
         ctk.CTkLabel(
             settings_frame, text="Interval:",
-            font=("Roboto", 10),
+            font=_font(10),
             text_color="#95A5A6"
         ).grid(row=0, column=9, padx=5, pady=8, sticky="w")
         
@@ -1039,103 +1494,128 @@ class OverpowerProtectionPanel(ctk.CTkFrame):
         self.adjustment_interval.grid(row=0, column=10, padx=5, pady=8)
         self.adjustment_interval.insert(0, str(protection_config.adjustment_interval))
         
-        ctk.CTkLabel(settings_frame, text="s", font=("Roboto", 10)).grid(row=0, column=11, padx=(0, 10), pady=8)
+        ctk.CTkLabel(settings_frame, text="s", font=_font(10)).grid(row=0, column=11, padx=(0, 10), pady=8)
         
         # Second row: Step size and recovery settings
         ctk.CTkLabel(
             settings_frame, text="Charge Step:",
-            font=("Roboto", 10),
-            text_color="#2ECC71"
+            font=_font(10),
+            text_color=COLOR_GREEN
         ).grid(row=1, column=0, padx=(10, 5), pady=8, sticky="w")
         
-        self.charge_step = ctk.CTkEntry(settings_frame, width=50, justify="center")
+        self.charge_step = ctk.CTkEntry(settings_frame, width=50, justify="center", validate="key", validatecommand=vcmd)
         self.charge_step.grid(row=1, column=1, padx=5, pady=8)
         self.charge_step.insert(0, str(protection_config.charge_step))
         
-        ctk.CTkLabel(settings_frame, text="A", font=("Roboto", 10)).grid(row=1, column=2, padx=(0, 10), pady=8)
+        ctk.CTkLabel(settings_frame, text="A", font=_font(10)).grid(row=1, column=2, padx=(0, 10), pady=8)
         
         # Recovery threshold (%) - when to start stepping down
         ctk.CTkLabel(
             settings_frame, text="Recovery at:",
-            font=("Roboto", 10),
-            text_color="#3498DB"
+            font=_font(10),
+            text_color=COLOR_BLUE
         ).grid(row=1, column=3, padx=5, pady=8, sticky="w")
         
-        self.recovery_threshold = ctk.CTkEntry(settings_frame, width=50, justify="center")
+        self.recovery_threshold = ctk.CTkEntry(settings_frame, width=50, justify="center", validate="key", validatecommand=vcmd)
         self.recovery_threshold.grid(row=1, column=4, padx=5, pady=8)
         self.recovery_threshold.insert(0, str(protection_config.recovery_threshold_pct))
         
-        ctk.CTkLabel(settings_frame, text="%", font=("Roboto", 10)).grid(row=1, column=5, padx=(0, 10), pady=8)
+        ctk.CTkLabel(settings_frame, text="%", font=_font(10)).grid(row=1, column=5, padx=(0, 10), pady=8)
         
         # Voltage recovery (V)
         ctk.CTkLabel(
             settings_frame, text="Voltage Recovery:",
-            font=("Roboto", 10),
-            text_color="#3498DB"
+            font=_font(10),
+            text_color=COLOR_BLUE
         ).grid(row=1, column=6, padx=5, pady=8, sticky="w")
         
-        self.voltage_recovery = ctk.CTkEntry(settings_frame, width=55, justify="center")
+        self.voltage_recovery = ctk.CTkEntry(settings_frame, width=55, justify="center", validate="key", validatecommand=vcmd)
         self.voltage_recovery.grid(row=1, column=7, padx=5, pady=8)
         self.voltage_recovery.insert(0, str(protection_config.voltage_recovery))
         
-        ctk.CTkLabel(settings_frame, text="V", font=("Roboto", 10)).grid(row=1, column=8, padx=(0, 10), pady=8)
+        ctk.CTkLabel(settings_frame, text="V", font=_font(10)).grid(row=1, column=8, padx=(0, 10), pady=8)
         
         # Voltage hold margin (V) - keeps boost while voltage is within this margin of warning
         ctk.CTkLabel(
             settings_frame, text="V Hold:",
-            font=("Roboto", 10),
+            font=_font(10),
             text_color="#9B59B6"
         ).grid(row=1, column=9, padx=5, pady=8, sticky="w")
         
-        self.voltage_hold_margin = ctk.CTkEntry(settings_frame, width=50, justify="center")
+        self.voltage_hold_margin = ctk.CTkEntry(settings_frame, width=50, justify="center", validate="key", validatecommand=vcmd)
         self.voltage_hold_margin.grid(row=1, column=10, padx=5, pady=8)
         self.voltage_hold_margin.insert(0, str(protection_config.voltage_hold_margin))
         
-        ctk.CTkLabel(settings_frame, text="V", font=("Roboto", 10)).grid(row=1, column=11, padx=(0, 10), pady=8)
+        ctk.CTkLabel(settings_frame, text="V", font=_font(10)).grid(row=1, column=11, padx=(0, 10), pady=8)
+        
+        # Settings are parsed when an entry is committed, not on every read
+        self._settings_cache = {key: getattr(protection_config, key) for _, key, _ in self._SETTING_FIELDS}
+        # Entries whose text can't be parsed are shown in red; the cache keeps their last value
+        self._invalid_settings = set()
+        self._entry_text_color = self.max_sell_power.cget("text_color")
+        for attr, _, _ in self._SETTING_FIELDS:
+            entry = getattr(self, attr)
+            entry.bind("<FocusOut>", lambda e, attr=attr: self._refresh_setting(attr))
+            entry.bind("<Return>", lambda e, attr=attr: self._refresh_setting(attr))
+        self._publish_settings()
         
         # Current state display
         state_frame = ctk.CTkFrame(self, fg_color="transparent")
         state_frame.grid(row=2, column=0, sticky="ew", padx=10, pady=5)
         state_frame.grid_columnconfigure((0, 1, 2), weight=1)
         
+        self._power_var = ctk.StringVar(value="Export: -- W / -- W")
         self.lbl_power_state = ctk.CTkLabel(
-            state_frame, text="Export: -- W / -- W",
-            font=("Roboto", 11),
-            text_color="#888888"
+            state_frame, textvariable=self._power_var,
+            font=_font(11),
+            text_color=COLOR_GRAY
         )
         self.lbl_power_state.grid(row=0, column=0, sticky="w", padx=10)
         
+        self._voltage_var = ctk.StringVar(value="Max Voltage: -- V")
         self.lbl_voltage_state = ctk.CTkLabel(
-            state_frame, text="Max Voltage: -- V",
-            font=("Roboto", 11),
-            text_color="#888888"
+            state_frame, textvariable=self._voltage_var,
+            font=_font(11),
+            text_color=COLOR_GRAY
         )
         self.lbl_voltage_state.grid(row=0, column=1)
         
+        self._protection_var = ctk.StringVar(value="Protection: Inactive")
         self.lbl_protection_state = ctk.CTkLabel(
-            state_frame, text="Protection: Inactive",
-            font=("Roboto", 11),
-            text_color="gray"
+            state_frame, textvariable=self._protection_var,
+            font=_font(11),
+            text_color=COLOR_TK_GRAY
         )
         self.lbl_protection_state.grid(row=0, column=2, sticky="e", padx=10)
         
+        # Text of the state labels is written through their StringVars, see _set_label()
+        self._label_vars = {
+            self.lbl_status: self._status_var,
+            self.lbl_power_state: self._power_var,
+            self.lbl_voltage_state: self._voltage_var,
+            self.lbl_protection_state: self._protection_var,
+        }
+        
         # Info label
         ctk.CTkLabel(
             self, text="Absorbs excess power into battery by increasing charge speed when export or voltage limits are approached.",
-            font=("Roboto", 10),
-            text_color="#888888"
+            font=_font(10),
+            text_color=COLOR_GRAY
         ).grid(row=3, column=0, pady=(5, 10))
     
     def _on_enable_toggle(self) -> None:
         """Handle enable/disable toggle."""
-        if self.enabled_var.get():
-            self.lbl_status.configure(text="Active", text_color="#2ECC71")
-        else:
-            self.lbl_status.configure(text="Disabled", text_color="gray")
-            self.lbl_protection_state.configure(text="Protection: Inactive", text_color="gray")
+        with self.batched_updates():
+            if self.enabled_var.get():
+                self._set_label(self.lbl_status, "Active", COLOR_GREEN)
+            else:
+                self._set_label(self.lbl_status, "Disabled", COLOR_TK_GRAY)
+                self._set_label(self.lbl_protection_state, "Protection: Inactive", COLOR_TK_GRAY)
+        self._publish_settings()
         
+        # Let the switch finish redrawing before the app reacts to the change
         if self.on_settings_change:
-            self.on_settings_change()
+            self.after_idle(self.on_settings_change)
     
     def is_enabled(self) -> bool:
         """Check if protection is enabled."""
@@ -1144,13 +1624,15 @@ class OverpowerProtectionPanel(ctk.CTkFrame):
     def set_enabled(self, enabled: bool) -> None:
         """Programmatically enable or disable the protection."""
         self.enabled_var.set(enabled)
-        if enabled:
-            self.enable_switch.select()
-            self.lbl_status.configure(text="Active", text_color="#2ECC71")
-        else:
-            self.enable_switch.deselect()
-            self.lbl_status.configure(text="Disabled (Selling)", text_color="#F39C12")
-            self.lbl_protection_state.configure(text="Protection: Paused by sell mode", text_color="#F39C12")
+        with self.batched_updates():
+            if enabled:
+                self.enable_switch.select()
+                self._set_label(self.lbl_status, "Active", COLOR_GREEN)
+            else:
+                self.enable_switch.deselect()
+                self._set_label(self.lbl_status, "Disabled (Selling)", COLOR_AMBER)
+                self._set_label(self.lbl_protection_state, "Protection: Paused by sell mode", COLOR_AMBER)
+        self._publish_settings()
         if self.on_settings_change:
             self.on_settings_change()
 
@@ -1158,6 +1640,7 @@ class OverpowerProtectionPanel(ctk.CTkFrame):
         """Set the max sell power value (e.g., from inverter reading)."""
         self.max_sell_power.delete(0, "end")
         self.max_sell_power.insert(0, str(power))
+        self._refresh_setting("max_sell_power")
     
     def _on_warning_changed(self, event=None) -> None:
         """
@@ -1171,66 +1654,134 @@ class OverpowerProtectionPanel(ctk.CTkFrame):
             self.voltage_recovery.insert(0, str(new_recovery))
         except ValueError:
             pass  # Ignore if value can't be parsed
+        self._cache_voltage_warning()
+        self._refresh_setting("voltage_warning")
+        self._refresh_setting("voltage_recovery")
     
-    def get_settings(self) -> dict:
-        """Get current protection settings."""
+    def _cache_voltage_warning(self, event=None) -> None:
+        """Re-parse the voltage warning entry into the float used by the state display."""
+        raw = self.voltage_warning.get()
         try:
-            return {
-                "enabled": self.enabled_var.get(),
-                "max_sell_power": int(self.max_sell_power.get()),
-                "power_threshold_pct": int(self.power_threshold.get()),
-                "recovery_threshold_pct": int(self.recovery_threshold.get()),
-                "voltage_warning": float(self.voltage_warning.get()),
-                "voltage_recovery": float(self.voltage_recovery.get()),
-                "voltage_hold_margin": float(self.voltage_hold_margin.get()),
-                "charge_step": int(self.charge_step.get()),
-                "adjustment_interval": protection_config.adjustment_interval,
-            }
+            self._voltage_warning_cached = float(raw) if raw else protection_config.voltage_warning
         except ValueError:
-            # Return defaults on parse error
-            return {
-                "enabled": False,
-                "max_sell_power": protection_config.max_sell_power,
-                "power_threshold_pct": protection_config.power_threshold_pct,
-                "recovery_threshold_pct": protection_config.recovery_threshold_pct,
-                "voltage_warning": protection_config.voltage_warning,
-                "voltage_recovery": protection_config.voltage_recovery,
-                "voltage_hold_margin": protection_config.voltage_hold_margin,
-                "charge_step": protection_config.charge_step,
-                "adjustment_interval": protection_config.adjustment_interval,
-            }
+            pass  # Keep the last valid value while the user is typing
+    
+    @staticmethod
+    def _is_numeric_input(value: str) -> bool:
+        """Entry validator: empty, or digits with at most one decimal point."""
+        return _NUMERIC_INPUT_RE.fullmatch(value) is not None
+    
+    def _refresh_setting(self, attr: str) -> None:
+        """
+        Parse one committed setting entry into the cache. An unparsable value keeps the
+        last one and the entry is flagged red, so the UI shows it isn't the one in use.
+        """
+        key, parse = self._SETTING_BY_ATTR[attr]
+        entry = getattr(self, attr)
+        try:
+            value = parse(entry.get())
+        except ValueError:
+            if attr not in self._invalid_settings:
+                self._invalid_settings.add(attr)
+                entry.configure(text_color=COLOR_RED)
+            return
+        if attr in self._invalid_settings:
+            self._invalid_settings.discard(attr)
+            entry.configure(text_color=self._entry_text_color)
+        if value != self._settings_cache[key]:
+            self._settings_cache[key] = value
+            self._publish_settings()
+    
+    def _publish_settings(self) -> None:
+        """Snapshot the parsed settings and enabled flag into the read-only view get_settings() returns."""
+        self._settings_view = MappingProxyType(dict(
+            self._settings_cache,
+            enabled=self.enabled_var.get(),
+            adjustment_interval=protection_config.adjustment_interval,
+        ))
+    
+    def get_settings(self) -> Mapping:
+        """Get current protection settings (a shared read-only snapshot)."""
+        return self._settings_view
     
     def update_state_display(self, export_power: int, max_sell: int, max_voltage: float) -> None:
-        """Update the state display labels."""
-        # Export power display
-        export_pct = (export_power / max_sell * 100) if max_sell > 0 else 0
-        power_color = "#E74C3C" if export_pct > 95 else "#F39C12" if export_pct > 85 else "#888888"
-        self.lbl_power_state.configure(
-            text=f"Export: {export_power} W / {max_sell} W ({export_pct:.0f}%)",
-            text_color=power_color
-        )
-        
-        # Voltage display
-        voltage_warning = float(self.voltage_warning.get()) if self.voltage_warning.get() else protection_config.voltage_warning
-        voltage_color = "#E74C3C" if max_voltage > voltage_warning else "#888888"
-        self.lbl_voltage_state.configure(
-            text=f"Max Voltage: {max_voltage:.1f} V",
-            text_color=voltage_color
-        )
+        """
+        Queue a state display update. A burst of calls is rendered once, on the next
+        idle or, if the last render was under _STATE_MIN_INTERVAL ago, once that has passed.
+        """
+        self._pending_state = (export_power, max_sell, max_voltage)
+        if not self._state_scheduled:
+            self._state_scheduled = True
+            wait = self._last_state_ts + self._STATE_MIN_INTERVAL - time.monotonic()
+            if wait > 0:
+                self.after(int(wait * 1000) + 1, self._flush_state)
+            else:
+                self.after_idle(self._flush_state)
+    
+    def _flush_state(self) -> None:
+        """Render the most recent queued state display update."""
+        self._state_scheduled = False
+        self._last_state_ts = time.monotonic()
+        export_power, max_sell, max_voltage = self._pending_state
+        
+        with self.batched_updates():
+            # Export power display
+            export_pct, power_color = _export_band(export_power, max_sell)
+            self._set_label(self.lbl_power_state, self._POWER_FMT(export_power, max_sell, export_pct), power_color)
+            
+            # Voltage display
+            voltage_warning = self._voltage_warning_cached
+            voltage_color = COLOR_RED if max_voltage > voltage_warning else COLOR_GRAY
+            self._set_label(self.lbl_voltage_state, self._VOLT_FMT(max_voltage), voltage_color)
     
     def update_protection_state(self, active: bool, boost_amps: int = 0, bms_limited: bool = False) -> None:
         """Update the protection state label."""
         if not self.enabled_var.get():
-            self.lbl_protection_state.configure(text="Protection: Disabled", text_color="gray")
+            self._set_label(self.lbl_protection_state, "Protection: Disabled", COLOR_TK_GRAY)
         elif active:
             suffix = " BMS_Limit" if bms_limited else ""
-            self.lbl_protection_state.configure(
-                text=f"Protection: ACTIVE (+{boost_amps}A boost){suffix}",
-                text_color="#E74C3C"
+            self._set_label(
+                self.lbl_protection_state,
+                f"Protection: ACTIVE (+{boost_amps}A boost){suffix}",
+                COLOR_RED
             )
         else:
             suffix = " BMS_Limit" if bms_limited else ""
-            self.lbl_protection_state.configure(text=f"Protection: Standby{suffix}", text_color="#F39C12" if bms_limited else "#2ECC71")
+            self._set_label(self.lbl_protection_state, f"Protection: Standby{suffix}", COLOR_AMBER if bms_limited else COLOR_GREEN)
+    
+    @contextmanager
+    def batched_updates(self):
+        """
+        Defer label writes until the outermost batch exits, so a burst of state
+        changes renders once with only the final value of each label. Reentrant.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self._flush_dirty()
+    
+    def _set_label(self, label: ctk.CTkLabel, text: str, color: str) -> None:
+        """Queue a state label update; applied now unless inside batched_updates()."""
+        self._dirty_labels[label] = (text, color)
+        if self._batch_depth == 0:
+            self._flush_dirty()
+    
+    def _flush_dirty(self) -> None:
+        """
+        Apply queued label updates: text goes through the StringVar, and configure()
+        (a full CTk redraw) is only called when the color actually changes.
+        """
+        dirty, self._dirty_labels = self._dirty_labels, {}
+        for label, (text, color) in dirty.items():
+            last_text, last_color = self._label_state.get(label, (None, None))
+            if text != last_text:
+                self._label_vars[label].set(text)
+            if color != last_color:
+                label.configure(text_color=color)
+            self._label_state[label] = (text, color)
 
 
 class SunsetChargingPanel(ctk.CTkFrame):
@@ -1254,8 +1805,8 @@ class SunsetChargingPanel(ctk.CTkFrame):
         
         ctk.CTkLabel(
             header_frame, text="\u2600 SUNSET CHARGING",
-            font=("Roboto", 14, "bold"),
-            text_color="#F39C12"
+            font=_font(14, "bold"),
+            text_color=COLOR_AMBER
         ).grid(row=0, column=0, sticky="w")
         
         # Enable/Disable switch
@@ -1263,7 +1814,7 @@ class SunsetChargingPanel(ctk.CTkFrame):
         self.enable_switch = ctk.CTkSwitch(
             header_frame, text="Enable",
             variable=self.enabled_var,
-            font=("Roboto", 11, "bold"),
+            font=_font(11, "bold"),
             command=self._on_enable_toggle
         )
         self.enable_switch.grid(row=0, column=1, padx=20)
@@ -1277,7 +1828,7 @@ class SunsetChargingPanel(ctk.CTkFrame):
         self.selling_first_switch = ctk.CTkSwitch(
             header_frame, text="Selling First",
             variable=self.selling_first_var,
-            font=("Roboto", 11, "bold"),
+            font=_font(11, "bold"),
             command=self._on_selling_first_toggle,
             progress_color="#16A085",
         )
@@ -1289,8 +1840,8 @@ class SunsetChargingPanel(ctk.CTkFrame):
         _startup_enabled = sunset_config.enabled_at_startup
         self.lbl_status = ctk.CTkLabel(
             header_frame, text="Active" if _startup_enabled else "Disabled",
-            font=("Roboto", 11),
-            text_color="#2ECC71" if _startup_enabled else "gray"
+            font=_font(11),
+            text_color=COLOR_GREEN if _startup_enabled else COLOR_TK_GRAY
         )
         self.lbl_status.grid(row=0, column=3, sticky="e", padx=10)
         
@@ -1300,81 +1851,81 @@ class SunsetChargingPanel(ctk.CTkFrame):
         settings_frame.grid_columnconfigure((1, 3, 5, 7, 9, 11), weight=1)
         
         # Latitude
-        ctk.CTkLabel(settings_frame, text="Lat:", font=("Roboto", 10, "bold"),
-                      text_color="#F39C12").grid(row=0, column=0, padx=(10, 2), pady=8, sticky="w")
+        ctk.CTkLabel(settings_frame, text="Lat:", font=_font(10, "bold"),
+                      text_color=COLOR_AMBER).grid(row=0, column=0, padx=(10, 2), pady=8, sticky="w")
         self.latitude = ctk.CTkEntry(settings_frame, width=65, justify="center")
         self.latitude.grid(row=0, column=1, padx=2, pady=8)
         self.latitude.insert(0, str(sunset_config.latitude))
         
         # Longitude
-        ctk.CTkLabel(settings_frame, text="Lon:", font=("Roboto", 10, "bold"),
-                      text_color="#F39C12").grid(row=0, column=2, padx=(10, 2), pady=8, sticky="w")
+        ctk.CTkLabel(settings_frame, text="Lon:", font=_font(10, "bold"),
+                      text_color=COLOR_AMBER).grid(row=0, column=2, padx=(10, 2), pady=8, sticky="w")
         self.longitude = ctk.CTkEntry(settings_frame, width=65, justify="center")
         self.longitude.grid(row=0, column=3, padx=2, pady=8)
         self.longitude.insert(0, str(sunset_config.longitude))
         
         # Battery Capacity (Ah)
-        ctk.CTkLabel(settings_frame, text="Battery:", font=("Roboto", 10),
-                      text_color="#3498DB").grid(row=0, column=4, padx=(10, 2), pady=8, sticky="w")
+        ctk.CTkLabel(settings_frame, text="Battery:", font=_font(10),
+                      text_color=COLOR_BLUE).grid(row=0, column=4, padx=(10, 2), pady=8, sticky="w")
         self.battery_capacity = ctk.CTkEntry(settings_frame, width=55, justify="center")
         self.battery_capacity.grid(row=0, column=5, padx=2, pady=8)
         self.battery_capacity.insert(0, str(sunset_config.battery_capacity_ah))
-        ctk.CTkLabel(settings_frame, text="Ah", font=("Roboto", 10)).grid(row=0, column=6, padx=(0, 5), pady=8)
+        ctk.CTkLabel(settings_frame, text="Ah", font=_font(10)).grid(row=0, column=6, padx=(0, 5), pady=8)
         
         # Target SOC
-        ctk.CTkLabel(settings_frame, text="Target:", font=("Roboto", 10),
-                      text_color="#2ECC71").grid(row=0, column=7, padx=(10, 2), pady=8, sticky="w")
+        ctk.CTkLabel(settings_frame, text="Target:", font=_font(10),
+                      text_color=COLOR_GREEN).grid(row=0, column=7, padx=(10, 2), pady=8, sticky="w")
         self.target_soc = ctk.CTkEntry(settings_frame, width=45, justify="center")
         self.target_soc.grid(row=0, column=8, padx=2, pady=8)
         self.target_soc.insert(0, str(sunset_config.target_soc))
-        ctk.CTkLabel(settings_frame, text="%", font=("Roboto", 10)).grid(row=0, column=9, padx=(0, 5), pady=8)
+        ctk.CTkLabel(settings_frame, text="%", font=_font(10)).grid(row=0, column=9, padx=(0, 5), pady=8)
         
         # Buffer time before sunset
-        ctk.CTkLabel(settings_frame, text="Buffer:", font=("Roboto", 10),
+        ctk.CTkLabel(settings_frame, text="Buffer:", font=_font(10),
                       text_color="#95A5A6").grid(row=0, column=10, padx=(10, 2), pady=8, sticky="w")
         self.buffer_minutes = ctk.CTkEntry(settings_frame, width=45, justify="center")
         self.buffer_minutes.grid(row=0, column=11, padx=2, pady=8)
         self.buffer_minutes.insert(0, str(sunset_config.buffer_minutes))
-        ctk.CTkLabel(settings_frame, text="min", font=("Roboto", 10)).grid(row=0, column=12, padx=(0, 10), pady=8)
+        ctk.CTkLabel(settings_frame, text="min", font=_font(10)).grid(row=0, column=12, padx=(0, 10), pady=8)
         
         # Second row: Min charge amps + Peak solar hour
-        ctk.CTkLabel(settings_frame, text="Min Charge:", font=("Roboto", 10),
-                      text_color="#2ECC71").grid(row=1, column=0, padx=(10, 2), pady=8, sticky="w")
+        ctk.CTkLabel(settings_frame, text="Min Charge:", font=_font(10),
+                      text_color=COLOR_GREEN).grid(row=1, column=0, padx=(10, 2), pady=8, sticky="w")
         self.min_charge = ctk.CTkEntry(settings_frame, width=45, justify="center")
         self.min_charge.grid(row=1, column=1, padx=2, pady=8)
         self.min_charge.insert(0, str(sunset_config.min_charge_amps))
-        ctk.CTkLabel(settings_frame, text="A", font=("Roboto", 10)).grid(row=1, column=2, padx=(0, 5), pady=8, sticky="w")
+        ctk.CTkLabel(settings_frame, text="A", font=_font(10)).grid(row=1, column=2, padx=(0, 5), pady=8, sticky="w")
 
         # Peak solar hour (0 = auto / solar noon)
-        ctk.CTkLabel(settings_frame, text="Peak Hour:", font=("Roboto", 10),
-                      text_color="#F39C12").grid(row=1, column=4, padx=(10, 2), pady=8, sticky="w")
+        ctk.CTkLabel(settings_frame, text="Peak Hour:", font=_font(10),
+                      text_color=COLOR_AMBER).grid(row=1, column=4, padx=(10, 2), pady=8, sticky="w")
         self.peak_solar_hour = ctk.CTkEntry(settings_frame, width=50, justify="center")
         self.peak_solar_hour.grid(row=1, column=5, padx=2, pady=8)
         self.peak_solar_hour.insert(0, str(sunset_config.peak_solar_hour) if sunset_config.peak_solar_hour > 0 else "auto")
-        ctk.CTkLabel(settings_frame, text="(0=auto)", font=("Roboto", 9),
+        ctk.CTkLabel(settings_frame, text="(0=auto)", font=_font(9),
                       text_color="#777").grid(row=1, column=6, padx=(0, 5), pady=8, sticky="w")
 
         # Third row: Cloudy day compensation
-        ctk.CTkLabel(settings_frame, text="Peak kW:", font=("Roboto", 10),
+        ctk.CTkLabel(settings_frame, text="Peak kW:", font=_font(10),
                       text_color="#E67E22").grid(row=2, column=0, padx=(10, 2), pady=8, sticky="w")
         self.peak_expected_kw = ctk.CTkEntry(settings_frame, width=50, justify="center")
         self.peak_expected_kw.grid(row=2, column=1, padx=2, pady=8)
         self.peak_expected_kw.insert(0, str(sunset_config.peak_expected_kw) if sunset_config.peak_expected_kw > 0 else "off")
-        ctk.CTkLabel(settings_frame, text="kW", font=("Roboto", 10)).grid(row=2, column=2, padx=(0, 5), pady=8, sticky="w")
+        ctk.CTkLabel(settings_frame, text="kW", font=_font(10)).grid(row=2, column=2, padx=(0, 5), pady=8, sticky="w")
 
-        ctk.CTkLabel(settings_frame, text="Cloud Thr:", font=("Roboto", 10),
+        ctk.CTkLabel(settings_frame, text="Cloud Thr:", font=_font(10),
                       text_color="#E67E22").grid(row=2, column=4, padx=(10, 2), pady=8, sticky="w")
         self.cloud_threshold = ctk.CTkEntry(settings_frame, width=40, justify="center")
         self.cloud_threshold.grid(row=2, column=5, padx=2, pady=8)
         self.cloud_threshold.insert(0, str(sunset_config.cloud_threshold_pct))
-        ctk.CTkLabel(settings_frame, text="%", font=("Roboto", 10)).grid(row=2, column=6, padx=(0, 5), pady=8, sticky="w")
+        ctk.CTkLabel(settings_frame, text="%", font=_font(10)).grid(row=2, column=6, padx=(0, 5), pady=8, sticky="w")
 
-        ctk.CTkLabel(settings_frame, text="Max Boost:", font=("Roboto", 10),
+        ctk.CTkLabel(settings_frame, text="Max Boost:", font=_font(10),
                       text_color="#E67E22").grid(row=2, column=7, padx=(10, 2), pady=8, sticky="w")
         self.cloud_max_boost = ctk.CTkEntry(settings_frame, width=40, justify="center")
         self.cloud_max_boost.grid(row=2, column=8, padx=2, pady=8)
         self.cloud_max_boost.insert(0, str(sunset_config.cloud_max_boost))
-        ctk.CTkLabel(settings_frame, text="x", font=("Roboto", 10)).grid(row=2, column=9, padx=(0, 5), pady=8, sticky="w")
+        ctk.CTkLabel(settings_frame, text="x", font=_font(10)).grid(row=2, column=9, padx=(0, 5), pady=8, sticky="w")
         
         # State display
         state_frame = ctk.CTkFrame(self, fg_color="#2B2B2B", corner_radius=5)
@@ -1383,25 +1934,25 @@ class SunsetChargingPanel(ctk.CTkFrame):
         
         self.lbl_sunset_time = ctk.CTkLabel(
             state_frame, text="Sunset: --:--",
-            font=("Roboto", 11, "bold"), text_color="#F39C12"
+            font=_font(11, "bold"), text_color=COLOR_AMBER
         )
         self.lbl_sunset_time.grid(row=0, column=0, padx=10, pady=5, sticky="w")
         
         self.lbl_time_remaining = ctk.CTkLabel(
             state_frame, text="Time left: --h --m",
-            font=("Roboto", 11, "bold"), text_color="#95A5A6"
+            font=_font(11, "bold"), text_color="#95A5A6"
         )
         self.lbl_time_remaining.grid(row=0, column=1, padx=10, pady=5)
         
         self.lbl_required_amps = ctk.CTkLabel(
             state_frame, text="Required: --A",
-            font=("Roboto", 11, "bold"), text_color="#3498DB"
+            font=_font(11, "bold"), text_color=COLOR_BLUE
         )
         self.lbl_required_amps.grid(row=0, column=2, padx=10, pady=5)
         
         self.lbl_weather = ctk.CTkLabel(
             state_frame, text="",
-            font=("Roboto", 10), text_color="#95A5A6"
+            font=_font(10), text_color="#95A5A6"
         )
         self.lbl_weather.grid(row=0, column=3, padx=10, pady=5, sticky="e")
         
@@ -1412,7 +1963,7 @@ class SunsetChargingPanel(ctk.CTkFrame):
         
         self.lbl_sparkline = ctk.CTkLabel(
             self.weather_bar_frame, text="",
-            font=("Segoe UI Emoji", 22), text_color="#F39C12",
+            font=_font(22, family="Segoe UI Emoji"), text_color=COLOR_AMBER,
             anchor="w"
         )
         self.lbl_sparkline.grid(row=0, column=0, padx=10, pady=4, sticky="ew")
@@ -1423,7 +1974,7 @@ class SunsetChargingPanel(ctk.CTkFrame):
         enabled = self.enabled_var.get()
         self.lbl_status.configure(
             text="Active" if enabled else "Disabled",
-            text_color="#2ECC71" if enabled else "gray"
+            text_color=COLOR_GREEN if enabled else COLOR_TK_GRAY
         )
         if self.on_settings_change:
             self.on_settings_change()
@@ -1493,24 +2044,24 @@ class SunsetChargingPanel(ctk.CTkFrame):
             m = int((hours_left - h) * 60)
             self.lbl_time_remaining.configure(
                 text=f"Time left: {h}h {m:02d}m",
-                text_color="#F39C12" if hours_left < 2 else "#95A5A6"
+                text_color=COLOR_AMBER if hours_left < 2 else "#95A5A6"
             )
         else:
-            self.lbl_time_remaining.configure(text="After sunset", text_color="#E74C3C")
+            self.lbl_time_remaining.configure(text="After sunset", text_color=COLOR_RED)
         
         if selling_first_paused:
             self.lbl_required_amps.configure(
                 text="Paused (Selling First)", text_color="#16A085"
             )
         elif active:
-            color = "#E74C3C" if required_amps > 100 else "#F39C12" if required_amps > 50 else "#2ECC71"
+            color = COLOR_RED if required_amps > 100 else COLOR_AMBER if required_amps > 50 else COLOR_GREEN
             cloud_str = f" \u2601{cloud_boost:.1f}x" if cloud_boost > 1.05 else ""
             self.lbl_required_amps.configure(text=f"Required: {required_amps}A{cloud_str}", text_color=color)
         else:
-            self.lbl_required_amps.configure(text="Standby", text_color="gray")
+            self.lbl_required_amps.configure(text="Standby", text_color=COLOR_TK_GRAY)
         
         if weather_str:
-            self.lbl_weather.configure(text=weather_str, text_color="#3498DB")
+            self.lbl_weather.configure(text=weather_str, text_color=COLOR_BLUE)
         else:
             self.lbl_weather.configure(text="", text_color="#95A5A6")
         
@@ -1542,13 +2093,13 @@ class EVChargerPanel(ctk.CTkFrame):
 
         ctk.CTkLabel(
             header, text="\U0001F50C EV SMART CHARGER",
-            font=("Roboto", 14, "bold"), text_color="#1ABC9C"
+            font=_font(14, "bold"), text_color="#1ABC9C"
         ).grid(row=0, column=0, sticky="w")
 
         self.enabled_var = ctk.BooleanVar(value=ev_charger_config.enabled)
         self.enable_switch = ctk.CTkSwitch(
             header, text="Enable", variable=self.enabled_var,
-            font=("Roboto", 11, "bold"), command=self._on_enable_toggle
+            font=_font(11, "bold"), command=self._on_enable_toggle
         )
         self.enable_switch.grid(row=0, column=1, padx=20)
         if ev_charger_config.enabled:
@@ -1558,7 +2109,7 @@ class EVChargerPanel(ctk.CTkFrame):
         self.boost_btn = ctk.CTkButton(
             header, text="\u26A1 Boost", width=90, height=28,
             fg_color="#555555", hover_color="#D35400",
-            font=("Roboto", 11, "bold"),
+            font=_font(11, "bold"),
             command=self._on_boost_click
         )
         self.boost_btn.grid(row=0, column=2, padx=10)
@@ -1567,8 +2118,8 @@ class EVChargerPanel(ctk.CTkFrame):
         self.lbl_status = ctk.CTkLabel(
             header,
             text="Active" if _startup else "Disabled",
-            font=("Roboto", 11),
-            text_color="#2ECC71" if _startup else "gray"
+            font=_font(11),
+            text_color=COLOR_GREEN if _startup else COLOR_TK_GRAY
         )
         self.lbl_status.grid(row=0, column=3, sticky="e", padx=10)
 
@@ -1577,52 +2128,52 @@ class EVChargerPanel(ctk.CTkFrame):
         sf.grid(row=1, column=0, sticky="ew", padx=10, pady=5)
         sf.grid_columnconfigure((1, 3, 5, 7, 9, 11, 15), weight=1)
 
-        ctk.CTkLabel(sf, text="Min Amps:", font=("Roboto", 10, "bold"),
+        ctk.CTkLabel(sf, text="Min Amps:", font=_font(10, "bold"),
                       text_color="#1ABC9C").grid(row=0, column=0, padx=(10, 5), pady=8, sticky="w")
         self.min_amps = ctk.CTkEntry(sf, width=50, justify="center")
         self.min_amps.grid(row=0, column=1, padx=5, pady=8)
         self.min_amps.insert(0, str(ev_charger_config.min_amps))
-        ctk.CTkLabel(sf, text="A", font=("Roboto", 10)).grid(row=0, column=2, padx=(0, 10), pady=8)
+        ctk.CTkLabel(sf, text="A", font=_font(10)).grid(row=0, column=2, padx=(0, 10), pady=8)
 
-        ctk.CTkLabel(sf, text="Max Amps:", font=("Roboto", 10, "bold"),
+        ctk.CTkLabel(sf, text="Max Amps:", font=_font(10, "bold"),
                       text_color="#1ABC9C").grid(row=0, column=3, padx=5, pady=8, sticky="w")
         self.max_amps = ctk.CTkEntry(sf, width=50, justify="center")
         self.max_amps.grid(row=0, column=4, padx=5, pady=8)
         self.max_amps.insert(0, str(ev_charger_config.max_amps))
-        ctk.CTkLabel(sf, text="A", font=("Roboto", 10)).grid(row=0, column=5, padx=(0, 10), pady=8)
+        ctk.CTkLabel(sf, text="A", font=_font(10)).grid(row=0, column=5, padx=(0, 10), pady=8)
 
-        ctk.CTkLabel(sf, text="Start SOC:", font=("Roboto", 10)).grid(row=0, column=6, padx=5, pady=8, sticky="w")
+        ctk.CTkLabel(sf, text="Start SOC:", font=_font(10)).grid(row=0, column=6, padx=5, pady=8, sticky="w")
         self.start_soc = ctk.CTkEntry(sf, width=50, justify="center")
         self.start_soc.grid(row=0, column=7, padx=5, pady=8)
         self.start_soc.insert(0, str(ev_charger_config.start_soc))
-        ctk.CTkLabel(sf, text="%", font=("Roboto", 10)).grid(row=0, column=8, padx=(0, 10), pady=8)
+        ctk.CTkLabel(sf, text="%", font=_font(10)).grid(row=0, column=8, padx=(0, 10), pady=8)
 
-        ctk.CTkLabel(sf, text="Stop SOC:", font=("Roboto", 10)).grid(row=0, column=9, padx=5, pady=8, sticky="w")
+        ctk.CTkLabel(sf, text="Stop SOC:", font=_font(10)).grid(row=0, column=9, padx=5, pady=8, sticky="w")
         self.stop_soc = ctk.CTkEntry(sf, width=50, justify="center")
         self.stop_soc.grid(row=0, column=10, padx=5, pady=8)
         self.stop_soc.insert(0, str(ev_charger_config.stop_soc))
-        ctk.CTkLabel(sf, text="%", font=("Roboto", 10)).grid(row=0, column=11, padx=(0, 10), pady=8)
+        ctk.CTkLabel(sf, text="%", font=_font(10)).grid(row=0, column=11, padx=(0, 10), pady=8)
 
-        ctk.CTkLabel(sf, text="Charge by:", font=("Roboto", 10),
+        ctk.CTkLabel(sf, text="Charge by:", font=_font(10),
                       text_color="#95A5A6").grid(row=0, column=12, padx=5, pady=8, sticky="w")
         self.charge_by_hour = ctk.CTkEntry(sf, width=50, justify="center")
         self.charge_by_hour.grid(row=0, column=13, padx=5, pady=8)
         self.charge_by_hour.insert(0, f"{ev_charger_config.charge_by_hour}:00")
-        ctk.CTkLabel(sf, text="h", font=("Roboto", 10)).grid(row=0, column=14, padx=(0, 10), pady=8)
+        ctk.CTkLabel(sf, text="h", font=_font(10)).grid(row=0, column=14, padx=(0, 10), pady=8)
 
         # ── Settings row 2: cooldown & solar mode ───────────────────
-        ctk.CTkLabel(sf, text="Cooldown:", font=("Roboto", 10),
+        ctk.CTkLabel(sf, text="Cooldown:", font=_font(10),
                       text_color="#95A5A6").grid(row=1, column=0, padx=(10, 5), pady=8, sticky="w")
         self.change_interval = ctk.CTkEntry(sf, width=50, justify="center")
         self.change_interval.grid(row=1, column=1, padx=5, pady=8)
         self.change_interval.insert(0, str(ev_charger_config.change_interval_minutes))
-        ctk.CTkLabel(sf, text="min", font=("Roboto", 10)).grid(row=1, column=2, padx=(0, 10), pady=8)
+        ctk.CTkLabel(sf, text="min", font=_font(10)).grid(row=1, column=2, padx=(0, 10), pady=8)
 
         self.solar_var = ctk.BooleanVar(value=ev_charger_config.solar_mode)
         self.solar_switch = ctk.CTkSwitch(
             sf, text="Solar Follow (ramp amps to solar export)",
             variable=self.solar_var,
-            font=("Roboto", 10, "bold"),
+            font=_font(10, "bold"),
             command=self._on_solar_toggle
         )
         self.solar_switch.grid(row=1, column=3, columnspan=5, padx=10, pady=8, sticky="w")
@@ -1634,37 +2185,37 @@ class EVChargerPanel(ctk.CTkFrame):
         self.grid_charge_switch = ctk.CTkSwitch(
             sf, text="Grid charge at",
             variable=self.grid_charge_var,
-            font=("Roboto", 10, "bold"),
+            font=_font(10, "bold"),
         )
         self.grid_charge_switch.grid(row=1, column=8, columnspan=3, padx=(15, 5), pady=8, sticky="w")
 
         self.grid_charge_amps = ctk.CTkEntry(sf, width=50, justify="center")
         self.grid_charge_amps.grid(row=1, column=11, padx=2, pady=8)
         self.grid_charge_amps.insert(0, str(ev_charger_config.grid_charge_amps))
-        ctk.CTkLabel(sf, text="A", font=("Roboto", 10)).grid(row=1, column=12, padx=(0, 10), pady=8)
+        ctk.CTkLabel(sf, text="A", font=_font(10)).grid(row=1, column=12, padx=(0, 10), pady=8)
 
         # ── Settings row 3: solar ramp-down + priority + step-down sustain
-        ctk.CTkLabel(sf, text="Ramp ↓ delay:", font=("Roboto", 10),
+        ctk.CTkLabel(sf, text="Ramp ↓ delay:", font=_font(10),
                       text_color="#95A5A6").grid(row=2, column=0, padx=(10, 5), pady=8, sticky="w")
         self.ramp_down_delay = ctk.CTkEntry(sf, width=50, justify="center")
         self.ramp_down_delay.grid(row=2, column=1, padx=5, pady=8)
         self.ramp_down_delay.insert(0, str(ev_charger_config.solar_ramp_down_delay))
-        ctk.CTkLabel(sf, text="min", font=("Roboto", 10)).grid(row=2, column=2, padx=(0, 10), pady=8)
+        ctk.CTkLabel(sf, text="min", font=_font(10)).grid(row=2, column=2, padx=(0, 10), pady=8)
 
-        ctk.CTkLabel(sf, text="Amp steps:", font=("Roboto", 10),
+        ctk.CTkLabel(sf, text="Amp steps:", font=_font(10),
                       text_color="#95A5A6").grid(row=2, column=3, padx=(10, 5), pady=8, sticky="w")
         self.amp_steps = ctk.CTkEntry(sf, width=100, justify="center")
         self.amp_steps.grid(row=2, column=4, columnspan=3, padx=5, pady=8)
         self.amp_steps.insert(0, ",".join(str(s) for s in ev_charger_config.solar_amp_steps))
-        ctk.CTkLabel(sf, text="A", font=("Roboto", 10)).grid(row=2, column=7, padx=(0, 10), pady=8)
+        ctk.CTkLabel(sf, text="A", font=_font(10)).grid(row=2, column=7, padx=(0, 10), pady=8)
 
         # Priority slider: Battery First ↔ EV First
-        ctk.CTkLabel(sf, text="Battery First", font=("Roboto", 10, "bold"),
-                      text_color="#F39C12").grid(row=2, column=8, padx=(15, 2), pady=8, sticky="e")
+        ctk.CTkLabel(sf, text="Battery First", font=_font(10, "bold"),
+                      text_color=COLOR_AMBER).grid(row=2, column=8, padx=(15, 2), pady=8, sticky="e")
         self.ev_first_var = ctk.BooleanVar(value=ev_charger_config.ev_first)
         self.ev_first_switch = ctk.CTkSwitch(
             sf, text="EV First", variable=self.ev_first_var,
-            font=("Roboto", 10, "bold"), text_color="#1ABC9C",
+            font=_font(10, "bold"), text_color="#1ABC9C",
         )
         self.ev_first_switch.grid(row=2, column=9, columnspan=2, padx=2, pady=8, sticky="w")
         if ev_charger_config.ev_first:
@@ -1679,19 +2230,19 @@ class EVChargerPanel(ctk.CTkFrame):
 
         self.lbl_charger_status = ctk.CTkLabel(
             state, text="Charger: --",
-            font=("Roboto", 11, "bold"), text_color="#888888"
+            font=_font(11, "bold"), text_color=COLOR_GRAY
         )
         self.lbl_charger_status.grid(row=0, column=0, padx=10, pady=5, sticky="w")
 
         self.lbl_ev_amps = ctk.CTkLabel(
             state, text="Amps: --",
-            font=("Roboto", 11, "bold"), text_color="#888888"
+            font=_font(11, "bold"), text_color=COLOR_GRAY
         )
         self.lbl_ev_amps.grid(row=0, column=1, padx=10, pady=5)
 
         self.lbl_ev_result = ctk.CTkLabel(
             state, text="--",
-            font=("Roboto", 11, "bold"), text_color="gray"
+            font=_font(11, "bold"), text_color=COLOR_TK_GRAY
         )
         self.lbl_ev_result.grid(row=0, column=2, padx=10, pady=5, sticky="e")
 
@@ -1700,7 +2251,7 @@ class EVChargerPanel(ctk.CTkFrame):
             self,
             text="Controls a Tuya EV charger based on battery SOC and solar export. "
                  "Changes are rate-limited to the configured cooldown.",
-            font=("Roboto", 10), text_color="#888888"
+            font=_font(10), text_color=COLOR_GRAY
         ).grid(row=3, column=0, pady=(5, 10))
 
     # ── Callbacks ────────────────────────────────────────────────────
@@ -1709,7 +2260,7 @@ class EVChargerPanel(ctk.CTkFrame):
         enabled = self.enabled_var.get()
         self.lbl_status.configure(
             text="Active" if enabled else "Disabled",
-            text_color="#2ECC71" if enabled else "gray"
+            text_color=COLOR_GREEN if enabled else COLOR_TK_GRAY
         )
         if self.on_settings_change:
             self.on_settings_change()
@@ -1774,42 +2325,42 @@ class EVChargerPanel(ctk.CTkFrame):
         # Charger connection status
         cloud_tag = " ☁" if is_cloud else ""
         if not connected:
-            self.lbl_charger_status.configure(text="Charger: Offline", text_color="#E74C3C")
+            self.lbl_charger_status.configure(text="Charger: Offline", text_color=COLOR_RED)
         elif error_state:
-            self.lbl_charger_status.configure(text=f"Charger: Error ({error_state}){cloud_tag}", text_color="#E74C3C")
+            self.lbl_charger_status.configure(text=f"Charger: Error ({error_state}){cloud_tag}", text_color=COLOR_RED)
         elif charging:
-            self.lbl_charger_status.configure(text=f"Charger: Charging{cloud_tag}", text_color="#2ECC71")
+            self.lbl_charger_status.configure(text=f"Charger: Charging{cloud_tag}", text_color=COLOR_GREEN)
         elif is_on:
-            self.lbl_charger_status.configure(text=f"Charger: ON (waiting for EV){cloud_tag}", text_color="#F39C12")
+            self.lbl_charger_status.configure(text=f"Charger: ON (waiting for EV){cloud_tag}", text_color=COLOR_AMBER)
         else:
-            self.lbl_charger_status.configure(text=f"Charger: Standby{cloud_tag}", text_color="#888888")
+            self.lbl_charger_status.configure(text=f"Charger: Standby{cloud_tag}", text_color=COLOR_GRAY)
 
         # Current amps
         if connected:
             self.lbl_ev_amps.configure(
                 text=f"Amps: {current_amps}A",
-                text_color="#1ABC9C" if charging else "#888888"
+                text_color="#1ABC9C" if charging else COLOR_GRAY
             )
         else:
-            self.lbl_ev_amps.configure(text="Amps: --", text_color="#888888")
+            self.lbl_ev_amps.configure(text="Amps: --", text_color=COLOR_GRAY)
 
         # Logic result
         full = f"{result_text}: {detail}" if detail else result_text
         color_map = {
-            "Battery Paced": "#3498DB",
-            "Charging": "#2ECC71",
+            "Battery Paced": COLOR_BLUE,
+            "Charging": COLOR_GREEN,
             "Solar Charging": "#1ABC9C",
             "Grid Charging": "#1ABC9C",
-            "Grid Pull Stop": "#E74C3C",
-            "Cooldown": "#F39C12",
-            "Stopped": "#E74C3C",
-            "Battery SOC too low": "#E74C3C",
+            "Grid Pull Stop": COLOR_RED,
+            "Cooldown": COLOR_AMBER,
+            "Stopped": COLOR_RED,
+            "Battery SOC too low": COLOR_RED,
             "Waiting for SOC": "#95A5A6",
-            "Idle": "#888888",
-            "EV Disabled": "gray",
-            "Charger Offline": "#E74C3C",
+            "Idle": COLOR_GRAY,
+            "EV Disabled": COLOR_TK_GRAY,
+            "Charger Offline": COLOR_RED,
         }
-        self.lbl_ev_result.configure(text=full, text_color=color_map.get(result_text, "#888888"))
+        self.lbl_ev_result.configure(text=full, text_color=color_map.get(result_text, COLOR_GRAY))
 
 
 class HeatpumpScheduleRow(ctk.CTkFrame):
@@ -1822,58 +2373,67 @@ class HeatpumpScheduleRow(ctk.CTkFrame):
         self.on_value_change = on_value_change
         self._dirty = False
 
+        # Outer grid holds four cells: checkbox, time group, temperature group
+        # (stretching), delete button. Each group packs its own widgets.
+        self.grid_columnconfigure(2, weight=1)
+
         # Enable checkbox
         self.enabled_var = ctk.BooleanVar(value=True)
         ctk.CTkCheckBox(self, text="", variable=self.enabled_var, width=20).grid(
             row=0, column=0, padx=(5, 10), pady=8)
 
+        self.time_frame = ctk.CTkFrame(self, fg_color="transparent")
+        self.time_frame.grid(row=0, column=1)
+
         # Start time
-        ctk.CTkLabel(self, text="From:", font=("Roboto", 10)).grid(row=0, column=1, padx=(0, 2), sticky="e")
-        self.start_hour = ctk.CTkEntry(self, width=40, justify="center", placeholder_text="HH")
-        self.start_hour.grid(row=0, column=2, padx=0)
+        ctk.CTkLabel(self.time_frame, text="From:", font=_font(10)).pack(side="left", padx=(0, 2))
+        self.start_hour = ctk.CTkEntry(self.time_frame, width=40, justify="center", placeholder_text="HH")
+        self.start_hour.pack(side="left")
         self.start_hour.insert(0, "00")
-        ctk.CTkLabel(self, text=":", font=("Roboto", 10, "bold")).grid(row=0, column=3, padx=0)
-        self.start_min = ctk.CTkEntry(self, width=40, justify="center", placeholder_text="MM")
-        self.start_min.grid(row=0, column=4, padx=0)
+        ctk.CTkLabel(self.time_frame, text=":", font=_font(10, "bold")).pack(side="left")
+        self.start_min = ctk.CTkEntry(self.time_frame, width=40, justify="center", placeholder_text="MM")
+        self.start_min.pack(side="left")
         self.start_min.insert(0, "00")
 
         # End time
-        ctk.CTkLabel(self, text="To:", font=("Roboto", 10)).grid(row=0, column=5, padx=(35, 2), sticky="e")
-        self.end_hour = ctk.CTkEntry(self, width=40, justify="center", placeholder_text="HH")
-        self.end_hour.grid(row=0, column=6, padx=0)
+        ctk.CTkLabel(self.time_frame, text="To:", font=_font(10)).pack(side="left", padx=(35, 2))
+        self.end_hour = ctk.CTkEntry(self.time_frame, width=40, justify="center", placeholder_text="HH")
+        self.end_hour.pack(side="left")
         self.end_hour.insert(0, "23")
-        ctk.CTkLabel(self, text=":", font=("Roboto", 10, "bold")).grid(row=0, column=7, padx=0)
-        self.end_min = ctk.CTkEntry(self, width=40, justify="center", placeholder_text="MM")
-        self.end_min.grid(row=0, column=8, padx=0)
+        ctk.CTkLabel(self.time_frame, text=":", font=_font(10, "bold")).pack(side="left")
+        self.end_min = ctk.CTkEntry(self.time_frame, width=40, justify="center", placeholder_text="MM")
+        self.end_min.pack(side="left")
         self.end_min.insert(0, "59")
 
+        self.temp_frame = ctk.CTkFrame(self, fg_color="transparent")
+        self.temp_frame.grid(row=0, column=2, sticky="w")
+
         # Min temperature
-        ctk.CTkLabel(self, text="Min Temp:", font=("Roboto", 10, "bold"),
-                      text_color="#E74C3C").grid(row=0, column=9, padx=(50, 2))
-        self.min_temp = ctk.CTkEntry(self, width=60, justify="center")
-        self.min_temp.grid(row=0, column=10, padx=2)
+        ctk.CTkLabel(self.temp_frame, text="Min Temp:", font=_font(10, "bold"),
+                      text_color=COLOR_RED).pack(side="left", padx=(50, 2))
+        self.min_temp = ctk.CTkEntry(self.temp_frame, width=60, justify="center")
+        self.min_temp.pack(side="left", padx=2)
         self.min_temp.insert(0, "28")
         self.min_temp.bind("<Key>", lambda e: self._mark_dirty())
         self.min_temp.bind("<FocusOut>", lambda e: self._on_field_change())
-        ctk.CTkLabel(self, text="°C", font=("Roboto", 10)).grid(row=0, column=11, padx=(0, 20))
+        ctk.CTkLabel(self.temp_frame, text="°C", font=_font(10)).pack(side="left", padx=(0, 20))
 
         # Max temperature
-        ctk.CTkLabel(self, text="Max Temp:", font=("Roboto", 10, "bold"),
-                      text_color="#2ECC71").grid(row=0, column=12, padx=(30, 2))
-        self.max_temp = ctk.CTkEntry(self, width=60, justify="center")
-        self.max_temp.grid(row=0, column=13, padx=2)
+        ctk.CTkLabel(self.temp_frame, text="Max Temp:", font=_font(10, "bold"),
+                      text_color=COLOR_GREEN).pack(side="left", padx=(30, 2))
+        self.max_temp = ctk.CTkEntry(self.temp_frame, width=60, justify="center")
+        self.max_temp.pack(side="left", padx=2)
         self.max_temp.insert(0, "35")
         self.max_temp.bind("<Key>", lambda e: self._mark_dirty())
         self.max_temp.bind("<FocusOut>", lambda e: self._on_field_change())
-        ctk.CTkLabel(self, text="°C", font=("Roboto", 10)).grid(row=0, column=14, padx=(0, 10))
+        ctk.CTkLabel(self.temp_frame, text="°C", font=_font(10)).pack(side="left", padx=(0, 10))
 
-        # Spacer + delete button
-        self.grid_columnconfigure(15, weight=1)
+        # Delete button (column 2 takes up the spare width)
         ctk.CTkButton(
             self, text="✕", width=30, height=24,
-            fg_color="#E74C3C", hover_color="#C0392B",
+            fg_color=COLOR_RED, hover_color="#C0392B",
             command=lambda: self.on_delete(self.index)
-        ).grid(row=0, column=16, padx=(5, 10))
+        ).grid(row=0, column=3, padx=(5, 10))
 
     def _mark_dirty(self) -> None:
         self._dirty = True
@@ -1899,13 +2459,13 @@ class HeatpumpScheduleRow(ctk.CTkFrame):
 
     def set_schedule(self, slot: HeatpumpScheduleSlot) -> None:
         self.start_hour.delete(0, "end")
-        self.start_hour.insert(0, str(slot.start_hour).zfill(2))
+        self.start_hour.insert(0, _pad2(slot.start_hour))
         self.start_min.delete(0, "end")
-        self.start_min.insert(0, str(slot.start_min).zfill(2))
+        self.start_min.insert(0, _pad2(slot.start_min))
         self.end_hour.delete(0, "end")
-        self.end_hour.insert(0, str(slot.end_hour).zfill(2))
+        self.end_hour.insert(0, _pad2(slot.end_hour))
         self.end_min.delete(0, "end")
-        self.end_min.insert(0, str(slot.end_min).zfill(2))
+        self.end_min.insert(0, _pad2(slot.end_min))
         self.min_temp.delete(0, "end")
         self.min_temp.insert(0, str(slot.min_temp))
         self.max_temp.delete(0, "end")
@@ -1936,13 +2496,13 @@ class HeatpumpPanel(ctk.CTkFrame):
 
         ctk.CTkLabel(
             header, text="\U0001F525 HEAT PUMP - Socket Thermostat (Tuya)",
-            font=("Roboto", 14, "bold"), text_color="#E67E22"
+            font=_font(14, "bold"), text_color="#E67E22"
         ).grid(row=0, column=0, sticky="w")
 
         self.enabled_var = ctk.BooleanVar(value=heatpump_config.enabled)
         self.enable_switch = ctk.CTkSwitch(
             header, text="Enable", variable=self.enabled_var,
-            font=("Roboto", 11, "bold"), command=self._on_enable_toggle
+            font=_font(11, "bold"), command=self._on_enable_toggle
         )
         self.enable_switch.grid(row=0, column=1, padx=20)
         if heatpump_config.enabled:
@@ -1952,7 +2512,7 @@ class HeatpumpPanel(ctk.CTkFrame):
         self.boost_btn = ctk.CTkButton(
             header, text="\u26A1 Boost", width=90, height=28,
             fg_color="#555555", hover_color="#D35400",
-            font=("Roboto", 11, "bold"),
+            font=_font(11, "bold"),
             command=self._on_boost_click
         )
         self.boost_btn.grid(row=0, column=2, padx=10)
@@ -1961,8 +2521,8 @@ class HeatpumpPanel(ctk.CTkFrame):
         self.lbl_status = ctk.CTkLabel(
             header,
             text="Active" if _startup else "Disabled",
-            font=("Roboto", 11),
-            text_color="#2ECC71" if _startup else "gray"
+            font=_font(11),
+            text_color=COLOR_GREEN if _startup else COLOR_TK_GRAY
         )
         self.lbl_status.grid(row=0, column=3, sticky="e", padx=10)
 
@@ -1974,106 +2534,106 @@ class HeatpumpPanel(ctk.CTkFrame):
         self.solar_switch = ctk.CTkSwitch(
             sf, text="Solar Override",
             variable=self.solar_override_var,
-            font=("Roboto", 10, "bold"),
+            font=_font(10, "bold"),
         )
         self.solar_switch.grid(row=0, column=0, padx=10, pady=8, sticky="w")
         if heatpump_config.solar_override_enabled:
             self.solar_switch.select()
 
-        ctk.CTkLabel(sf, text="Trigger:", font=("Roboto", 10, "bold"),
-                      text_color="#F39C12").grid(row=0, column=1, padx=(15, 2), pady=8, sticky="e")
+        ctk.CTkLabel(sf, text="Trigger:", font=_font(10, "bold"),
+                      text_color=COLOR_AMBER).grid(row=0, column=1, padx=(15, 2), pady=8, sticky="e")
         self.solar_production_min = ctk.CTkEntry(sf, width=60, justify="center")
         self.solar_production_min.grid(row=0, column=2, padx=2, pady=8, sticky="w")
         self.solar_production_min.insert(0, str(heatpump_config.solar_override_production_min))
-        ctk.CTkLabel(sf, text="W production", font=("Roboto", 10)).grid(row=0, column=3, padx=(0, 10), pady=8)
+        ctk.CTkLabel(sf, text="W production", font=_font(10)).grid(row=0, column=3, padx=(0, 10), pady=8)
 
-        ctk.CTkLabel(sf, text="Export:", font=("Roboto", 10, "bold"),
-                      text_color="#F39C12").grid(row=0, column=4, padx=(10, 2), pady=8, sticky="e")
+        ctk.CTkLabel(sf, text="Export:", font=_font(10, "bold"),
+                      text_color=COLOR_AMBER).grid(row=0, column=4, padx=(10, 2), pady=8, sticky="e")
         self.solar_export_min = ctk.CTkEntry(sf, width=60, justify="center")
         self.solar_export_min.grid(row=0, column=5, padx=2, pady=8, sticky="w")
         self.solar_export_min.insert(0, str(heatpump_config.solar_override_export_min))
-        ctk.CTkLabel(sf, text="W export", font=("Roboto", 10)).grid(row=0, column=6, padx=(0, 10), pady=8)
+        ctk.CTkLabel(sf, text="W export", font=_font(10)).grid(row=0, column=6, padx=(0, 10), pady=8)
 
-        ctk.CTkLabel(sf, text="HP Power:", font=("Roboto", 10, "bold"),
-                      text_color="#E74C3C").grid(row=0, column=7, padx=(10, 2), pady=8, sticky="e")
+        ctk.CTkLabel(sf, text="HP Power:", font=_font(10, "bold"),
+                      text_color=COLOR_RED).grid(row=0, column=7, padx=(10, 2), pady=8, sticky="e")
         self.solar_hp_power = ctk.CTkEntry(sf, width=60, justify="center")
         self.solar_hp_power.grid(row=0, column=8, padx=2, pady=8, sticky="w")
         self.solar_hp_power.insert(0, str(heatpump_config.solar_override_hp_power))
-        ctk.CTkLabel(sf, text="W", font=("Roboto", 10)).grid(row=0, column=9, padx=(0, 8), pady=8)
+        ctk.CTkLabel(sf, text="W", font=_font(10)).grid(row=0, column=9, padx=(0, 8), pady=8)
 
-        ctk.CTkLabel(sf, text="Delay:", font=("Roboto", 10, "bold"),
+        ctk.CTkLabel(sf, text="Delay:", font=_font(10, "bold"),
                       text_color="#95A5A6").grid(row=0, column=10, padx=(8, 2), pady=8, sticky="e")
         self.solar_delay = ctk.CTkEntry(sf, width=45, justify="center")
         self.solar_delay.grid(row=0, column=11, padx=2, pady=8, sticky="w")
         self.solar_delay.insert(0, str(heatpump_config.solar_override_delay))
-        ctk.CTkLabel(sf, text="s", font=("Roboto", 10)).grid(row=0, column=12, padx=(0, 10), pady=8)
+        ctk.CTkLabel(sf, text="s", font=_font(10)).grid(row=0, column=12, padx=(0, 10), pady=8)
 
-        ctk.CTkLabel(sf, text="\u2601 Cloudy:", font=("Roboto", 10, "bold"),
-                      text_color="#3498DB").grid(row=0, column=13, padx=(10, 2), pady=8, sticky="e")
+        ctk.CTkLabel(sf, text="\u2601 Cloudy:", font=_font(10, "bold"),
+                      text_color=COLOR_BLUE).grid(row=0, column=13, padx=(10, 2), pady=8, sticky="e")
         self.solar_cloudy_production = ctk.CTkEntry(sf, width=60, justify="center")
         self.solar_cloudy_production.grid(row=0, column=14, padx=2, pady=8, sticky="w")
         self.solar_cloudy_production.insert(0, str(heatpump_config.solar_override_cloudy_production_min))
-        ctk.CTkLabel(sf, text="W", font=("Roboto", 10)).grid(row=0, column=15, padx=(0, 10), pady=8)
+        ctk.CTkLabel(sf, text="W", font=_font(10)).grid(row=0, column=15, padx=(0, 10), pady=8)
 
         # ── Settings row: SOC & Voltage overrides ───────────────────
         vf = ctk.CTkFrame(self, fg_color="#2B2B2B", corner_radius=5)
         vf.grid(row=2, column=0, sticky="ew", padx=10, pady=5)
 
-        ctk.CTkLabel(vf, text="SOC ON:", font=("Roboto", 10, "bold"),
-                      text_color="#2ECC71").grid(row=0, column=0, padx=(10, 2), pady=8, sticky="e")
+        ctk.CTkLabel(vf, text="SOC ON:", font=_font(10, "bold"),
+                      text_color=COLOR_GREEN).grid(row=0, column=0, padx=(10, 2), pady=8, sticky="e")
         self.soc_on_entry = ctk.CTkEntry(vf, width=45, justify="center")
         self.soc_on_entry.grid(row=0, column=1, padx=2, pady=8, sticky="w")
         self.soc_on_entry.insert(0, str(heatpump_config.soc_on_threshold))
-        ctk.CTkLabel(vf, text="%", font=("Roboto", 10)).grid(row=0, column=2, padx=(0, 8), pady=8)
+        ctk.CTkLabel(vf, text="%", font=_font(10)).grid(row=0, column=2, padx=(0, 8), pady=8)
 
-        ctk.CTkLabel(vf, text="SOC OFF:", font=("Roboto", 10, "bold"),
-                      text_color="#E74C3C").grid(row=0, column=3, padx=(8, 2), pady=8, sticky="e")
+        ctk.CTkLabel(vf, text="SOC OFF:", font=_font(10, "bold"),
+                      text_color=COLOR_RED).grid(row=0, column=3, padx=(8, 2), pady=8, sticky="e")
         self.soc_off_entry = ctk.CTkEntry(vf, width=45, justify="center")
         self.soc_off_entry.grid(row=0, column=4, padx=2, pady=8, sticky="w")
         self.soc_off_entry.insert(0, str(heatpump_config.soc_off_threshold))
-        ctk.CTkLabel(vf, text="%", font=("Roboto", 10)).grid(row=0, column=5, padx=(0, 8), pady=8)
+        ctk.CTkLabel(vf, text="%", font=_font(10)).grid(row=0, column=5, padx=(0, 8), pady=8)
 
-        ctk.CTkLabel(vf, text="HV ON:", font=("Roboto", 10, "bold"),
+        ctk.CTkLabel(vf, text="HV ON:", font=_font(10, "bold"),
                       text_color="#1ABC9C").grid(row=0, column=6, padx=(8, 2), pady=8, sticky="e")
         self.hv_entry = ctk.CTkEntry(vf, width=50, justify="center")
         self.hv_entry.grid(row=0, column=7, padx=2, pady=8, sticky="w")
         self.hv_entry.insert(0, str(heatpump_config.hv_threshold))
-        ctk.CTkLabel(vf, text="V", font=("Roboto", 10)).grid(row=0, column=8, padx=(0, 4), pady=8)
+        ctk.CTkLabel(vf, text="V", font=_font(10)).grid(row=0, column=8, padx=(0, 4), pady=8)
 
-        ctk.CTkLabel(vf, text="HV OFF:", font=("Roboto", 10, "bold"),
-                      text_color="#3498DB").grid(row=0, column=9, padx=(4, 2), pady=8, sticky="e")
+        ctk.CTkLabel(vf, text="HV OFF:", font=_font(10, "bold"),
+                      text_color=COLOR_BLUE).grid(row=0, column=9, padx=(4, 2), pady=8, sticky="e")
         self.hv_off_entry = ctk.CTkEntry(vf, width=50, justify="center")
         self.hv_off_entry.grid(row=0, column=10, padx=2, pady=8, sticky="w")
         self.hv_off_entry.insert(0, str(heatpump_config.hv_off_threshold))
-        ctk.CTkLabel(vf, text="V", font=("Roboto", 10)).grid(row=0, column=11, padx=(0, 8), pady=8)
+        ctk.CTkLabel(vf, text="V", font=_font(10)).grid(row=0, column=11, padx=(0, 8), pady=8)
 
-        ctk.CTkLabel(vf, text="LV OFF:", font=("Roboto", 10, "bold"),
+        ctk.CTkLabel(vf, text="LV OFF:", font=_font(10, "bold"),
                       text_color="#E67E22").grid(row=0, column=12, padx=(8, 2), pady=8, sticky="e")
         self.lv_entry = ctk.CTkEntry(vf, width=50, justify="center")
         self.lv_entry.grid(row=0, column=13, padx=2, pady=8, sticky="w")
         self.lv_entry.insert(0, str(heatpump_config.lv_threshold))
-        ctk.CTkLabel(vf, text="V", font=("Roboto", 10)).grid(row=0, column=14, padx=(0, 4), pady=8)
+        ctk.CTkLabel(vf, text="V", font=_font(10)).grid(row=0, column=14, padx=(0, 4), pady=8)
 
-        ctk.CTkLabel(vf, text="Delay:", font=("Roboto", 10, "bold"),
+        ctk.CTkLabel(vf, text="Delay:", font=_font(10, "bold"),
                       text_color="#E67E22").grid(row=0, column=15, padx=(4, 2), pady=8, sticky="e")
         self.phase_delay_entry = ctk.CTkEntry(vf, width=40, justify="center")
         self.phase_delay_entry.grid(row=0, column=16, padx=2, pady=8, sticky="w")
         self.phase_delay_entry.insert(0, str(heatpump_config.phase_change_delay))
-        ctk.CTkLabel(vf, text="s", font=("Roboto", 10)).grid(row=0, column=17, padx=(0, 4), pady=8)
+        ctk.CTkLabel(vf, text="s", font=_font(10)).grid(row=0, column=17, padx=(0, 4), pady=8)
 
-        ctk.CTkLabel(vf, text="LV Recovery:", font=("Roboto", 10, "bold"),
+        ctk.CTkLabel(vf, text="LV Recovery:", font=_font(10, "bold"),
                       text_color="#E67E22").grid(row=0, column=18, padx=(4, 2), pady=8, sticky="e")
         self.lv_recovery_entry = ctk.CTkEntry(vf, width=50, justify="center")
         self.lv_recovery_entry.grid(row=0, column=19, padx=2, pady=8, sticky="w")
         self.lv_recovery_entry.insert(0, str(heatpump_config.lv_recovery_voltage))
-        ctk.CTkLabel(vf, text="V", font=("Roboto", 10)).grid(row=0, column=20, padx=(0, 4), pady=8)
+        ctk.CTkLabel(vf, text="V", font=_font(10)).grid(row=0, column=20, padx=(0, 4), pady=8)
 
-        ctk.CTkLabel(vf, text="Recovery Delay:", font=("Roboto", 10, "bold"),
+        ctk.CTkLabel(vf, text="Recovery Delay:", font=_font(10, "bold"),
                       text_color="#E67E22").grid(row=0, column=21, padx=(4, 2), pady=8, sticky="e")
         self.lv_recovery_delay_entry = ctk.CTkEntry(vf, width=50, justify="center")
         self.lv_recovery_delay_entry.grid(row=0, column=22, padx=2, pady=8, sticky="w")
         self.lv_recovery_delay_entry.insert(0, str(heatpump_config.lv_recovery_delay))
-        ctk.CTkLabel(vf, text="s", font=("Roboto", 10)).grid(row=0, column=23, padx=(0, 10), pady=8)
+        ctk.CTkLabel(vf, text="s", font=_font(10)).grid(row=0, column=23, padx=(0, 10), pady=8)
 
         # ── Schedule header + Add button ────────────────────────────
         sched_header = ctk.CTkFrame(self, fg_color="transparent")
@@ -2082,7 +2642,7 @@ class HeatpumpPanel(ctk.CTkFrame):
 
         ctk.CTkLabel(
             sched_header, text="Temperature Schedules:",
-            font=("Roboto", 11, "bold"), text_color="#E67E22"
+            font=_font(11, "bold"), text_color="#E67E22"
         ).grid(row=0, column=0, sticky="w")
 
         ctk.CTkButton(
@@ -2098,7 +2658,7 @@ class HeatpumpPanel(ctk.CTkFrame):
 
         self.lbl_info = ctk.CTkLabel(
             self, text="Add time slots with min/max temperature targets for the heat pump.",
-            font=("Roboto", 10), text_color="#888888"
+            font=_font(10), text_color=COLOR_GRAY
         )
         self.lbl_info.grid(row=5, column=0, pady=(2, 5))
 
@@ -2109,19 +2669,19 @@ class HeatpumpPanel(ctk.CTkFrame):
 
         self.lbl_hp_status = ctk.CTkLabel(
             state_frame, text="Outlet: --",
-            font=("Roboto", 11, "bold"), text_color="#888888"
+            font=_font(11, "bold"), text_color=COLOR_GRAY
         )
         self.lbl_hp_status.grid(row=0, column=0, padx=10, pady=5, sticky="w")
 
         self.lbl_hp_temp = ctk.CTkLabel(
             state_frame, text="Temp: --°C",
-            font=("Roboto", 11, "bold"), text_color="#888888"
+            font=_font(11, "bold"), text_color=COLOR_GRAY
         )
         self.lbl_hp_temp.grid(row=0, column=1, padx=10, pady=5)
 
         self.lbl_hp_result = ctk.CTkLabel(
             state_frame, text="--",
-            font=("Roboto", 11, "bold"), text_color="gray"
+            font=_font(11, "bold"), text_color=COLOR_TK_GRAY
         )
         self.lbl_hp_result.grid(row=0, column=2, padx=10, pady=5, sticky="e")
 
@@ -2136,7 +2696,7 @@ class HeatpumpPanel(ctk.CTkFrame):
         enabled = self.enabled_var.get()
         self.lbl_status.configure(
             text="Active" if enabled else "Disabled",
-            text_color="#2ECC71" if enabled else "gray"
+            text_color=COLOR_GREEN if enabled else COLOR_TK_GRAY
         )
         if self.on_settings_change:
             self.on_settings_change()
@@ -2154,9 +2714,10 @@ class HeatpumpPanel(ctk.CTkFrame):
         if 0 <= index < len(self.schedule_rows):
             self.schedule_rows[index].destroy()
             self.schedule_rows.pop(index)
-            for i, row in enumerate(self.schedule_rows):
+            for i in range(index, len(self.schedule_rows)):
+                row = self.schedule_rows[i]
                 row.index = i
-                row.grid(row=i, column=0, sticky="ew", pady=3)
+                row.grid_configure(row=i)
         if not self.schedule_rows:
             self.lbl_info.grid(row=5, column=0, pady=(2, 5))
 
@@ -2237,37 +2798,37 @@ class HeatpumpPanel(ctk.CTkFrame):
         """Update the live state display labels."""
         # Device connection + target status
         if not connected:
-            self.lbl_hp_status.configure(text="Outlet: Offline", text_color="#E74C3C")
+            self.lbl_hp_status.configure(text="Outlet: Offline", text_color=COLOR_RED)
         elif target_temp is not None:
-            self.lbl_hp_status.configure(text=f"Target: {target_temp:.0f}°C", text_color="#2ECC71" if is_on else "#F39C12")
+            self.lbl_hp_status.configure(text=f"Target: {target_temp:.0f}°C", text_color=COLOR_GREEN if is_on else COLOR_AMBER)
         else:
-            self.lbl_hp_status.configure(text="Target: --°C", text_color="#888888")
+            self.lbl_hp_status.configure(text="Target: --°C", text_color=COLOR_GRAY)
 
         # Temperature + target
         if temperature is not None:
-            temp_color = "#E74C3C" if temperature > 50 else "#F39C12" if temperature > 40 else "#2ECC71"
+            temp_color = COLOR_RED if temperature > 50 else COLOR_AMBER if temperature > 40 else COLOR_GREEN
             target_str = f" → {target_temp:.0f}°C" if target_temp is not None else ""
             self.lbl_hp_temp.configure(text=f"Temp: {temperature:.1f}°C{target_str}", text_color=temp_color)
         else:
-            self.lbl_hp_temp.configure(text="Temp: --°C", text_color="#888888")
+            self.lbl_hp_temp.configure(text="Temp: --°C", text_color=COLOR_GRAY)
 
         # Logic result
         full = f"{result_text}: {detail}" if detail else result_text
         color_map = {
-            "HP: Schedule Active": "#2ECC71",
+            "HP: Schedule Active": COLOR_GREEN,
             "HP: Solar Override": "#1ABC9C",
-            "HP: SOC Override": "#2ECC71",
+            "HP: SOC Override": COLOR_GREEN,
             "HP: Boost": "#E67E22",
             "HP: HV Override": "#00FFFF",
-            "HP: LV Shutdown": "#E74C3C",
-            "HP: SOC Low": "#E74C3C",
-            "HP: No Active Schedule": "#F39C12",
-            "HP: Standby": "#888888",
+            "HP: LV Shutdown": COLOR_RED,
+            "HP: SOC Low": COLOR_RED,
+            "HP: No Active Schedule": COLOR_AMBER,
+            "HP: Standby": COLOR_GRAY,
             "HP: No Temperature": "#95A5A6",
-            "HP Offline": "#E74C3C",
-            "HP Disabled": "gray",
+            "HP Offline": COLOR_RED,
+            "HP Disabled": COLOR_TK_GRAY,
         }
-        self.lbl_hp_result.configure(text=full, text_color=color_map.get(result_text, "#888888"))
+        self.lbl_hp_result.configure(text=full, text_color=color_map.get(result_text, COLOR_GRAY))
 
 
 class BatteryStatsDialog(ctk.CTkToplevel):
@@ -2277,10 +2838,10 @@ class BatteryStatsDialog(ctk.CTkToplevel):
     SECTION_BG = "#1E1E1E"
     LABEL_COLOR = "#AAAAAA"
     VALUE_COLOR = "#FFFFFF"
-    HEADER_COLOR = "#3498DB"
-    GOOD_COLOR = "#2ECC71"
-    WARN_COLOR = "#F39C12"
-    BAD_COLOR = "#E74C3C"
+    HEADER_COLOR = COLOR_BLUE
+    GOOD_COLOR = COLOR_GREEN
+    WARN_COLOR = COLOR_AMBER
+    BAD_COLOR = COLOR_RED
     
     BATTERY_TYPES = {
         0x0000: "Pylon/Solax (CAN)",
@@ -2324,7 +2885,7 @@ class BatteryStatsDialog(ctk.CTkToplevel):
         if bms_data is None:
             ctk.CTkLabel(
                 scroll, text="Failed to read BMS data.\nCheck inverter connection.",
-                font=("Roboto", 18, "bold"), text_color=self.BAD_COLOR
+                font=_font(18, "bold"), text_color=self.BAD_COLOR
             ).grid(row=0, column=0, pady=40)
             self._add_close_button(scroll, 1)
             return
@@ -2406,7 +2967,7 @@ class BatteryStatsDialog(ctk.CTkToplevel):
         # Section header
         ctk.CTkLabel(
             parent, text=title,
-            font=("Roboto", 16, "bold"),
+            font=_font(16, "bold"),
             text_color=self.HEADER_COLOR
         ).grid(row=start_row, column=0, pady=(15, 5), padx=10, sticky="w")
         start_row += 1
@@ -2419,13 +2980,13 @@ class BatteryStatsDialog(ctk.CTkToplevel):
         for i, (label, value, color) in enumerate(items):
             ctk.CTkLabel(
                 frame, text=label,
-                font=("Roboto", 13),
+                font=_font(13),
                 text_color=self.LABEL_COLOR
             ).grid(row=i, column=0, padx=(15, 10), pady=3, sticky="w")
             
             ctk.CTkLabel(
                 frame, text=value,
-                font=("Roboto", 13, "bold"),
+                font=_font(13, "bold"),
                 text_color=color
             ).grid(row=i, column=1, padx=(10, 15), pady=3, sticky="e")
         
@@ -2436,7 +2997,7 @@ class BatteryStatsDialog(ctk.CTkToplevel):
         ctk.CTkButton(
             parent, text="Close",
             command=self.destroy,
-            font=("Roboto", 14, "bold"),
+            font=_font(14, "bold"),
             width=120, height=36,
             fg_color="#2C3E50",
             hover_color="#34495E",
@@ -1,15 +1,31 @@
+# Manual Tapo connectivity check, run as: python tests/test_tapo.py
+# (nothing here is named test_*, so pytest collects no tests from it)
 import asyncio
 import os
-from dotenv import load_dotenv
 from tapo import ApiClient
 
-load_dotenv()
+# Authenticated handle is reused across calls in the same process
+_client = None
+_device = None
 
-async def test():
-    # Try owner account - shared devices may not work with API
-    client = ApiClient("alexandruilea95@gmail.com", "N44Xb0c*0ntIequw8V2D")
-    device = await client.p110(os.getenv("TAPO_IP"))
+
+async def _get_device():
+    global _client, _device
+    if _device is None:
+        # Try owner account - shared devices may not work with API
+        _client = ApiClient(os.environ["TAPO_EMAIL"], os.environ["TAPO_PASSWORD"])
+        _device = await _client.p110(os.environ["TAPO_IP"])
+    return _device
+
+
+async def check_connection():
+    device = await _get_device()
     info = await device.get_device_info()
     print(f"Connected! Device on: {info.device_on}")
 
-asyncio.run(test())
+
+if __name__ == "__main__":
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    asyncio.run(check_connection())
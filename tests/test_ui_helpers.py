@@ -0,0 +1,101 @@
+"""Tests for the pure formatting and validation helpers in src.ui_components."""
+import pytest
+
+pytest.importorskip("customtkinter")
+pytest.importorskip("dotenv")
+
+from src.ui_components import (  # noqa: E402
+    COLOR_AMBER,
+    COLOR_GRAY,
+    COLOR_RED,
+    OverpowerProtectionPanel,
+    _export_band,
+    _hhmm,
+    _pad2,
+    _parse_charge_pair,
+    _parse_time_range,
+)
+
+
+@pytest.mark.parametrize("value, expected", [
+    (0, "00"), (7, "07"), (23, "23"), (59, "59"), (99, "99"),
+    (100, "100"), (-1, "-1"),
+])
+def test_pad2(value, expected):
+    assert _pad2(value) == expected
+    assert _pad2(value) == f"{value:02d}"
+
+
+@pytest.mark.parametrize("hour, minute, expected", [
+    (0, 0, "00:00"), (6, 5, "06:05"), (23, 59, "23:59"), (100, 0, "100:00"),
+])
+def test_hhmm(hour, minute, expected):
+    assert _hhmm(hour, minute) == expected
+
+
+@pytest.mark.parametrize("export_power, max_sell, color", [
+    (0, 1000, COLOR_GRAY),
+    (850, 1000, COLOR_GRAY),    # exactly 85% is not above the amber threshold
+    (851, 1000, COLOR_AMBER),
+    (950, 1000, COLOR_AMBER),   # exactly 95% is not above the red threshold
+    (951, 1000, COLOR_RED),
+    (2550, 3000, COLOR_GRAY),   # 85.0%
+    (2553, 3000, COLOR_AMBER),  # 85.1% - floor division would have shown gray
+    (2851, 3000, COLOR_RED),    # 95.03% - floor division would have shown amber
+    (500, 0, COLOR_GRAY),       # unknown max sell power
+])
+def test_export_band_color(export_power, max_sell, color):
+    assert _export_band(export_power, max_sell)[1] == color
+
+
+@pytest.mark.parametrize("max_sell", [1000, 3000, 4600])
+def test_export_band_percent_matches_rounded_ratio(max_sell):
+    for export_power in range(0, max_sell + 1, 7):
+        pct, _ = _export_band(export_power, max_sell)
+        assert pct == int(f"{export_power / max_sell * 100:.0f}")
+
+
+def test_export_band_without_max_sell():
+    assert _export_band(500, 0) == (0, COLOR_GRAY)
+
+
+@pytest.mark.parametrize("value", ["", "5", "12", "12.", ".", ".5", "12.5"])
+def test_numeric_input_accepts_partial_numbers(value):
+    assert OverpowerProtectionPanel._is_numeric_input(value)
+
+
+@pytest.mark.parametrize("value", ["abc", "1.2.3", "-1", "1e5", "²", " 1"])
+def test_numeric_input_rejects_non_numbers(value):
+    assert not OverpowerProtectionPanel._is_numeric_input(value)
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("06:00-22:00", (6, 0, 22, 0)),
+    ("6:0-7:5", (6, 0, 7, 5)),
+    ("00:00-23:59", (0, 0, 23, 59)),
+    ("22:00-06:00", (22, 0, 6, 0)),  # overnight slot
+    (" 06:00-22:00 ", (6, 0, 22, 0)),
+])
+def test_parse_time_range_accepts(text, expected):
+    assert _parse_time_range(text) == expected
+
+
+@pytest.mark.parametrize("text", [
+    "", "6:0-", "06:00", "06:00-", "0600-2200", "06:00-22:00-23:00", "006:00-22:00",
+    "24:00-06:00", "06:00-24:00", "25:99-06:00", "06:60-22:00", "06:00-22:60",
+    "10:00-10:00",  # empty range
+])
+def test_parse_time_range_rejects(text):
+    assert _parse_time_range(text) is None
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("60/40", (60, 40)), ("0/0", (0, 0)), ("185/5", (185, 5)), (" 60/40 ", (60, 40)),
+])
+def test_parse_charge_pair_accepts(text, expected):
+    assert _parse_charge_pair(text) == expected
+
+
+@pytest.mark.parametrize("text", ["", "10/", "/40", "60", "60/40/20", "60-40", "a/b"])
+def test_parse_charge_pair_rejects(text):
+    assert _parse_charge_pair(text) is None